@@ -1,6 +1,7 @@
 import random
 from uuid import uuid4
 
+import numpy as np
 import pygame
 from pygame.sprite import Sprite
 
@@ -10,12 +11,48 @@ from src.enums import Attributes, Defence, EventType, MessagePacket, Shapes, Mat
 from src.handlers.genetics import Genome
 
 
+class StateField:
+    """Critter attribute kept in a column of the species' CritterState arrays."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, critter, owner=None):
+        if critter is None:
+            return self
+        return critter._arrays[self.name].item(critter._index)
+
+    def __set__(self, critter, value):
+        critter._arrays[self.name][critter._index] = value
+
+
 class Critter(Sprite):
-    def __init__(self, surface, context):
+    # Per-tick lifecycle state; Species steps these for the whole population
+    # at once. A critter outside a Species (not yet added, or dead) is never
+    # stepped and only keeps its values in one-row arrays of its own
+    STATE_FIELDS = ("time", "age", "energy", "max_lifespan", "current_mating_timeout")
+    time = StateField()
+    age = StateField()
+    energy = StateField()
+    max_lifespan = StateField()
+    current_mating_timeout = StateField()
+
+    # Sprites shared by every critter that looks the same, see get_sprite
+    sprites = {}
+
+    def __init__(self, world, context):
         # Unique ID and inheritance setup
         self.id = uuid4()
         super().__init__()
 
+        self._arrays = {
+            name: np.zeros(1, dtype=np.int64) for name in self.STATE_FIELDS
+        }
+        self._index = 0
+        # Running population aggregates, set while the critter is in a Species
+        self.stats = None
+        self._fitness = 0
+
         # Backup context for crossover
         self.creation_context = context
 
@@ -77,109 +114,122 @@ class Critter(Sprite):
         self.max_speed = context.get(Attributes.MAX_SPEED)
 
         # Environment setup
-        self.env_surface = surface
+        self.world = world
         self.seed = random.randint(0, 1000)
         self.done = False
 
-        # Positioning & visual rendering
+        # Vision range; sprites come from the shared cache on first draw, so
+        # headless runs never allocate surfaces
+        self._sprite_pair = None
         surface_size = (
             self.size + self.border["thickness"] + (2 * self.vision["radius"])
         )
-        self.image = pygame.Surface((surface_size, surface_size), pygame.SRCALPHA)
-        self.defense_image = self.image.copy()
-
-        # Center calculation
-        self.center = (surface_size // 2, surface_size // 2)
 
         # Rect & collision setup
-        self.rect = self.image.get_rect()
-        self.rect.center = position or helper.get_random_position(surface)
+        self.rect = pygame.Rect(0, 0, surface_size, surface_size)
+        self.rect.center = position or helper.get_random_position(world)
         self.interaction_rect = self.rect.inflate(
             (-2 * self.vision["radius"]) + 10,
             (-2 * self.vision["radius"]) + 10,
         )
-        self.body_rect = self.rect.inflate(
-            -2 * self.vision["radius"] + 10,
-            -2 * self.vision["radius"] + 10,
-        )
-        self.body_rect.center = self.center
-        self.previous_position = self.rect.center
+        self.body_rect = pygame.Rect(0, 0, self.size, self.size)
+        self.body_rect.center = self.rect.center
         self.creation_context["position"] = self.rect.center
 
-    def draw(self, surface):
-        if not self.alive:
-            return
+    @property
+    def fitness(self):
+        return self._fitness
 
-        if self.time > 1:
-            if self.defense_active:
-                current_surface = self.defense_image
-            else:
-                current_surface = self.image
+    @fitness.setter
+    def fitness(self, value):
+        if self.stats is not None:
+            self.stats.add_fitness(self.species, value - self._fitness)
+        self._fitness = value
 
-            return surface.blit(current_surface, self.rect)
+    @property
+    def image(self):
+        return self.get_sprite(
+            self.domain, self.size, self.color, self.defense_mechanism, False
+        )
 
-        color = self.color
+    @property
+    def defense_image(self):
+        return self.get_sprite(
+            self.domain, self.size, self.color, self.defense_mechanism, True
+        )
 
-        self.body_rect = pygame.Rect(0, 0, self.size, self.size)
-        self.body_rect.center = self.center
+    def draw(self, surface):
+        if not self.alive:
+            return
+
+        return surface.blit(*self.get_blit())
+
+    def get_blit(self):
+        """Returns the (sprite, topleft) pair that draws the critter right now."""
+        if self._sprite_pair is None:
+            self._sprite_pair = (self.image, self.defense_image)
+        sprite = self._sprite_pair[self.defense_active]
+        x, y = self.rect.center
+        half = sprite.get_width() // 2
+        return sprite, (x - half, y - half)
+
+    @classmethod
+    def get_sprite(cls, domain, size, color, defense_mechanism, defense_active):
+        """Returns the shared sprite for a look, drawing it on first request."""
+        key = (domain, size, tuple(color), defense_mechanism, defense_active)
+        sprite = cls.sprites.get(key)
+        if sprite is None:
+            sprite = cls.sprites[key] = cls._render_sprite(*key)
+        return sprite
+
+    @staticmethod
+    def _render_sprite(domain, size, color, defense_mechanism, defense_active):
+        # Sized to the body, or to the defense drawn around it (the sword's
+        # squares are inscribed in the 20px larger defense rect)
+        side = size + 22 if defense_active else size + 2
+        sprite = pygame.Surface((side, side), pygame.SRCALPHA)
+
+        body_rect = pygame.Rect(0, 0, size, size)
+        body_rect.center = (side // 2, side // 2)
 
         # temporary rect used to draw defense mechanism
-        defense_rect = self.body_rect.inflate(20, 20)
+        defense_rect = body_rect.inflate(20, 20)
 
         # Defense mechanism
-        if self.defense_mechanism == Defence.SWORDLING:
+        if defense_mechanism == Defence.CAMOUFLING:
+            color = (color[0], color[1], color[2], int(0.2 * 255))
+        elif not defense_active:
+            pass
+        elif defense_mechanism == Defence.SWORDLING:
             square_1 = helper.get_square_points(defense_rect)
             square_2 = helper.get_square_points(defense_rect, 45)
-            pygame.draw.polygon(self.defense_image, (125, 28, 74, 180), square_1)
-            pygame.draw.polygon(self.defense_image, (125, 28, 74, 180), square_2)
-        elif self.defense_mechanism == Defence.SHIELDLING:
-            pygame.draw.rect(
-                self.defense_image,
-                (255, 255, 255),
-                defense_rect.inflate(-10, -10),
-                3,
-            )
-        elif self.defense_mechanism == Defence.CAMOUFLING:
-            color = (color[0], color[1], color[2], int(0.2 * 255))
+            pygame.draw.polygon(sprite, (125, 28, 74, 180), square_1)
+            pygame.draw.polygon(sprite, (125, 28, 74, 180), square_2)
+        elif defense_mechanism == Defence.SHIELDLING:
+            pygame.draw.rect(sprite, (255, 255, 255), defense_rect.inflate(-10, -10), 3)
 
         # Critter
-        for image_surface in [self.image, self.defense_image]:
-            if self.domain == Shapes.CIRCLE:
-                pygame.draw.circle(image_surface, color, self.center, self.size // 2)
-            elif self.domain == Shapes.SQUARE:
-                pygame.draw.rect(image_surface, color, self.body_rect)
-            elif self.domain == Shapes.TRIANGLE:
-                points = helper.get_triangle_points(self.body_rect)
-                pygame.draw.polygon(image_surface, color, points)
-            elif self.domain == Shapes.PENTAGON:
-                points = helper.get_pentagon_points(self.body_rect)
-                pygame.draw.polygon(image_surface, color, points)
-
-        surface.blit(self.image, self.rect)
-
-    def step(self, events):
-        if not self.done:
-            self.time += 1
-            self.age += 1
-            self.energy -= 1
-
-            if self.energy <= 0 or self.age >= self.max_lifespan:
-                self.die()
-                return
-
-            self.update_mating_state()
-
-            obs = self.genome.observe(self)
-            outputs = self.genome.forward(obs)
-            self.genome.step(outputs, self)
-            self.update_rect()
-
-            if self.energy > self.max_energy:
-                self.energy = self.max_energy
+        if domain == Shapes.CIRCLE:
+            pygame.draw.circle(sprite, color, body_rect.center, size // 2)
+        elif domain == Shapes.SQUARE:
+            pygame.draw.rect(sprite, color, body_rect)
+        elif domain == Shapes.TRIANGLE:
+            points = helper.get_triangle_points(body_rect)
+            pygame.draw.polygon(sprite, color, points)
+        elif domain == Shapes.PENTAGON:
+            points = helper.get_pentagon_points(body_rect)
+            pygame.draw.polygon(sprite, color, points)
+
+        return sprite
+
+    def sense(self):
+        """First half of a Species step; the forward pass is batched between."""
+        return self.genome.observe(self)
+
+    def act(self, outputs):
+        self.genome.step(outputs, self)
 
     def update_mating_state(self):
-        self.current_mating_timeout -= 1
-
         if self.mating_state == MatingState.MINOR:
             if self.age >= self.age_of_maturity:
                 self.mating_state = MatingState.READY
@@ -211,39 +261,15 @@ class Critter(Sprite):
         elif self.mating_state == MatingState.MATING:
             pass
 
-    def update_rect(self):
-        # Enforce max movement offset
-        dx = max(
-            -self.max_speed,
-            min(self.max_speed, self.rect.centerx - self.previous_position[0]),
-        )
-        dy = max(
-            -self.max_speed,
-            min(self.max_speed, self.rect.centery - self.previous_position[1]),
+    def set_center(self, center):
+        """Moves the critter and its helper rects to a committed world position."""
+        self.rect.center = center
+        self.body_rect.center = center
+        self.interaction_rect.center = (
+            center[0] + config.ENV_OFFSET_X,
+            center[1] + config.ENV_OFFSET_Y,
         )
 
-        # Apply the constrained movement
-        self.rect.centerx = (
-            self.previous_position[0] + dx
-        ) % self.env_surface.get_width()
-        self.rect.centery = (
-            self.previous_position[1] + dy
-        ) % self.env_surface.get_height()
-
-        # Update other rectangles
-        self.body_rect.center = self.rect.center
-        self.interaction_rect.center = self.rect.center
-
-        self.interaction_rect.centerx = (
-            self.interaction_rect.centerx + config.ENV_OFFSET_X
-        )
-        self.interaction_rect.centery = (
-            self.interaction_rect.centery + config.ENV_OFFSET_Y
-        )
-
-        # Store updated position
-        self.previous_position = self.rect.center
-
     def set_mate(self, mate):
         self.mating_state = MatingState.MATING
         self.mate = mate
@@ -283,7 +309,7 @@ class Critter(Sprite):
 class Plant(Sprite):
     def __init__(
         self,
-        env_surface,
+        world,
         pos=None,
         radius=4,
         n=200,
@@ -291,27 +317,33 @@ class Plant(Sprite):
     ):
         super().__init__()
 
-        self.env_surface = env_surface
+        self.world = world
 
         self.radius = radius
         self.n = n
+        self.color = color
+        self._image = None
 
-        # Create a transparent surface for the food
-        self.image = pygame.Surface(((2 * radius), (2 * radius)), pygame.SRCALPHA)
-
-        # Random position within env_window bounds
+        # Random position within world bounds
         self.position = pos or (
-            random.randint(radius + 75, env_surface.get_width() - radius - 75),
-            random.randint(radius + 75, env_surface.get_height() - radius - 75),
+            random.randint(radius + 75, world.get_width() - radius - 75),
+            random.randint(radius + 75, world.get_height() - radius - 75),
         )
 
-        # Create the circle on the image surface (center of the surface)
-        pygame.draw.circle(self.image, color, (radius, radius), radius)
-
         # Get rect for positioning
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect(0, 0, 2 * radius, 2 * radius)
         self.rect.center = self.position
 
+    @property
+    def image(self):
+        if self._image is None:
+            # Create the circle on a transparent surface for the food
+            self._image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            pygame.draw.circle(
+                self._image, self.color, (self.radius, self.radius), self.radius
+            )
+        return self._image
+
     def draw(self, surface):
         # Blit the food image to the env_window at its position
         surface.blit(self.image, self.rect.topleft)
@@ -0,0 +1,168 @@
+"""
+Runs many independent headless worlds across worker processes.
+
+A job is a dict describing one world:
+
+    {
+        "designs": [...],  # species designs, as the laboratory releases them
+        "seed": 7,
+        "ticks": 5000,
+        "world_size": (1379, 937),  # optional
+        "survivors": 20,  # optional, fittest survivors to report
+        "workers": 0,  # optional, vision-scan processes inside the world
+    }
+
+The batch already runs one world per process, so worlds scan serially
+unless a job asks for workers of its own; LIFEOFPY_WORKERS is not inherited.
+
+``run_batch`` yields a ``(job index, summary, error)`` triple per job as
+soon as it finishes, in completion order. Only one of summary and error is
+set; a job whose worker process dies is retried alone and reported as an
+error if it keeps crashing, while the other jobs carry on.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import copy
+import os
+import random
+
+import numpy as np
+
+from src.config import ENV_HEIGHT, ENV_WIDTH
+from src.enums import Attributes
+from src.nature import Nature
+
+# Points per history series in a summary
+SUMMARY_POINTS = 256
+
+
+def run_world(job):
+    """Runs one job's world to its tick budget and returns its summary."""
+    random.seed(job["seed"])
+    np.random.seed(job["seed"])
+
+    env = Nature(
+        headless=True,
+        world_size=job.get("world_size", (ENV_WIDTH, ENV_HEIGHT)),
+        workers=job.get("workers", 0),
+    )
+    for design in job["designs"]:
+        env.create_species(copy.deepcopy(design))
+
+    for _ in range(job["ticks"]):
+        if not env.species.get_critters():
+            break  # Extinct, nothing left to simulate
+        env.step()
+
+    survivors = sorted(
+        env.species.get_critters(), key=lambda critter: critter.fitness, reverse=True
+    )[: job.get("survivors", 20)]
+
+    return {
+        "seed": job["seed"],
+        "ticks": env.time_steps,
+        "population": summarize_history(env.population_history),
+        "fitness": summarize_history(env.fitness_history),
+        "plants": summarize_history(env.plant_history),
+        "survivors": [
+            {
+                Attributes.SPECIES: critter.species,
+                Attributes.AGE: critter.age,
+                Attributes.ENERGY: critter.energy,
+                Attributes.FITNESS: critter.fitness,
+                Attributes.CHILDREN: critter.children,
+                "genome": critter.genome.get_genome_data(),
+            }
+            for critter in survivors
+        ],
+    }
+
+
+def summarize_history(history, max_points=SUMMARY_POINTS):
+    times, lows, means, highs = history.get_window(max_points)
+    return {
+        "names": list(history.names),
+        "times": times,
+        "lows": lows,
+        "means": means,
+        "highs": highs,
+    }
+
+
+def run_batch(jobs, workers=None, retries=1):
+    """
+    Yields (job index, summary, error) for every job as it completes.
+
+    At most ``workers`` jobs are in flight, so when a worker dies and takes
+    the pool down only those are in doubt. They are rerun one process each,
+    which pins the crash on the job that caused it; that job is retried up
+    to ``retries`` times before being reported. Exceptions raised by a job
+    are reported right away, as a rerun would raise them again.
+    """
+    jobs = list(jobs)
+    workers = workers or os.cpu_count()
+    pending = deque(range(len(jobs)))
+    crashes = [0] * len(jobs)
+
+    while pending:
+        suspects = yield from _run_pool(jobs, pending, workers)
+        while suspects:
+            crashed = yield from _run_isolated(jobs, suspects)
+            suspects = []
+            for index in crashed:
+                crashes[index] += 1
+                if crashes[index] > retries:
+                    yield index, None, "worker process crashed"
+                else:
+                    suspects.append(index)
+
+
+def _run_pool(jobs, pending, workers):
+    """
+    Runs pending jobs, keeping `workers` in flight. Returns the in-flight
+    jobs if the pool broke, leaving the unstarted ones in pending.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        running = {}
+        while pending or running:
+            while pending and len(running) < workers:
+                index = pending.popleft()
+                running[executor.submit(run_world, jobs[index])] = index
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    yield index, future.result(), None
+                except BrokenProcessPool:
+                    return [index, *running.values()]
+                except Exception as e:
+                    yield index, None, repr(e)
+    return []
+
+
+def _run_isolated(jobs, indices):
+    """Runs each job in a process of its own; returns the ones that crashed."""
+    executors = {index: ProcessPoolExecutor(max_workers=1) for index in indices}
+    crashed = []
+    try:
+        running = {
+            executor.submit(run_world, jobs[index]): index
+            for index, executor in executors.items()
+        }
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    yield index, future.result(), None
+                except BrokenProcessPool:
+                    crashed.append(index)
+                except Exception as e:
+                    yield index, None, repr(e)
+    finally:
+        for executor in executors.values():
+            executor.shutdown(cancel_futures=True)
+    return crashed
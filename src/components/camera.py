@@ -0,0 +1,98 @@
+import math
+
+import pygame
+
+
+class Camera:
+    """
+    Maps the world onto the env view. The view shows the world from
+    (x, y) onwards, scaled by zoom; zooming out stops once the whole world
+    fits, and a world smaller than the view is centered in it.
+
+    ``version`` changes with every pan or zoom, so layers drawn through the
+    camera can tell when they went stale.
+    """
+
+    MAX_ZOOM = 4.0
+    ZOOM_STEP = 1.25
+
+    def __init__(self, view_size, world_size):
+        self.view_width, self.view_height = view_size
+        self.world_width, self.world_height = world_size
+        self.min_zoom = min(
+            1.0,
+            self.view_width / self.world_width,
+            self.view_height / self.world_height,
+        )
+        self.x = 0.0
+        self.y = 0.0
+        self.zoom = 1.0
+        self.version = 0
+        self._clamp()
+
+    @property
+    def world_size(self):
+        return self.world_width, self.world_height
+
+    @property
+    def world_rect(self):
+        """The part of the world inside the view."""
+        left, top = math.floor(self.x), math.floor(self.y)
+        right = math.ceil(self.x + self.view_width / self.zoom)
+        bottom = math.ceil(self.y + self.view_height / self.zoom)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def world_to_view(self, position):
+        return (
+            round((position[0] - self.x) * self.zoom),
+            round((position[1] - self.y) * self.zoom),
+        )
+
+    def view_to_world(self, position):
+        return (
+            position[0] / self.zoom + self.x,
+            position[1] / self.zoom + self.y,
+        )
+
+    def world_rect_to_view(self, rect):
+        left, top = self.world_to_view(rect.topleft)
+        right, bottom = self.world_to_view(rect.bottomright)
+        return pygame.Rect(left, top, right - left, bottom - top)
+
+    def view_rect_to_world(self, rect):
+        """Smallest world rect covering a rect of the view."""
+        left, top = self.view_to_world(rect.topleft)
+        right, bottom = self.view_to_world(rect.bottomright)
+        left, top = math.floor(left), math.floor(top)
+        return pygame.Rect(left, top, math.ceil(right) - left, math.ceil(bottom) - top)
+
+    def pan(self, dx, dy):
+        """Moves the view by (dx, dy) view pixels."""
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self._clamp()
+
+    def zoom_at(self, position, factor):
+        """Zooms by factor, keeping the world point under `position` in place."""
+        zoom = min(max(self.zoom * factor, self.min_zoom), self.MAX_ZOOM)
+        if math.isclose(zoom, 1.0):
+            zoom = 1.0  # Land back on unscaled sprites after zooming in and out
+        world_x, world_y = self.view_to_world(position)
+        self.zoom = zoom
+        self.x = world_x - position[0] / zoom
+        self.y = world_y - position[1] / zoom
+        self._clamp()
+
+    def _clamp(self):
+        # Keep the view inside the world, or the world centered in the view
+        span_x = self.view_width / self.zoom
+        span_y = self.view_height / self.zoom
+        if span_x >= self.world_width:
+            self.x = (self.world_width - span_x) / 2
+        else:
+            self.x = min(max(self.x, 0), self.world_width - span_x)
+        if span_y >= self.world_height:
+            self.y = (self.world_height - span_y) / 2
+        else:
+            self.y = min(max(self.y, 0), self.world_height - span_y)
+        self.version += 1
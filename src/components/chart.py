@@ -0,0 +1,149 @@
+import math
+
+import numpy as np
+import pygame
+
+from src import helper
+from src.config import Colors, Fonts
+
+
+class LineChart:
+    """
+    Line chart for the graphs sidebar, drawn from a SeriesHistory. The
+    surface is only redrawn when the history got a sample or a series
+    color changed since the last draw.
+
+    When there are more samples than pixel columns, each column draws the
+    min/max range of the samples falling in it, so spikes stay visible.
+    """
+
+    MARGIN_LEFT = 42
+    MARGIN_BOTTOM = 22
+    MARGIN_TOP = 10
+    MARGIN_RIGHT = 12
+    TICKS = 5
+
+    def __init__(self, size, bg_color=Colors.white):
+        self.surface = pygame.Surface(size)
+        self.bg_color = bg_color
+        self.font = helper.get_font(Fonts.PixelifySans, 12)
+        self.plot_rect = pygame.Rect(
+            self.MARGIN_LEFT,
+            self.MARGIN_TOP,
+            size[0] - self.MARGIN_LEFT - self.MARGIN_RIGHT,
+            size[1] - self.MARGIN_TOP - self.MARGIN_BOTTOM,
+        )
+
+        self.colors = {}
+        self.drawn_samples = None
+        self.dirty = True
+
+    def set_color(self, name, color):
+        if self.colors.get(name) != color:
+            self.colors[name] = color
+            self.dirty = True
+
+    def draw(self, history):
+        """Redraws the chart if history or a color changed since the last draw."""
+        if not self.dirty and self.drawn_samples == len(history):
+            return False
+        self.dirty = False
+        self.drawn_samples = len(history)
+
+        self.surface.fill(self.bg_color)
+        if not len(history):
+            pygame.draw.rect(self.surface, Colors.bg_color, self.plot_rect, 1)
+            return True
+
+        times, lows, _, highs = history.get_window(self.plot_rect.width)
+        t0, t1 = times[0], times[-1]
+        if t0 == t1:
+            t1 = t0 + 1
+        y0, y1 = lows.min(), highs.max()
+        if y0 == y1:
+            y0, y1 = y0 - 1, y1 + 1
+
+        y_ticks = self._nice_ticks(y0, y1)
+        x_ticks = self._nice_ticks(t0, t1)
+        y0, y1 = min(y0, y_ticks[0]), max(y1, y_ticks[-1])
+
+        plot = self.plot_rect
+        columns = self._to_columns(times, t0, t1)
+
+        for column, name in enumerate(history.names):
+            points = self._downsample(columns, lows[:, column], highs[:, column])
+            ys = plot.bottom - 1 - (points[:, 1] - y0) / (y1 - y0) * (plot.height - 1)
+            xs = plot.left + points[:, 0]
+            color = self.colors.get(name, Colors.white)
+            if len(xs) == 1:
+                self.surface.set_at((int(xs[0]), int(ys[0])), color)
+            else:
+                pygame.draw.lines(
+                    self.surface, color, False, np.column_stack((xs, ys)).tolist()
+                )
+
+        self._draw_axes(x_ticks, y_ticks, t0, t1, y0, y1)
+        return True
+
+    def _to_columns(self, times, t0, t1):
+        """Pixel column of every sample inside the plot area."""
+        return ((times - t0) / (t1 - t0) * (self.plot_rect.width - 1)).astype(np.int64)
+
+    def _downsample(self, columns, lows, highs):
+        """
+        (column, value) points to draw: one per sample while every sample
+        is a single value in its own column, else a max-then-min pair per
+        occupied column.
+        """
+        starts = np.flatnonzero(np.r_[True, columns[1:] != columns[:-1]])
+        if len(starts) == len(columns) and np.array_equal(lows, highs):
+            return np.column_stack((columns, lows))
+
+        maxima = np.maximum.reduceat(highs, starts)
+        minima = np.minimum.reduceat(lows, starts)
+        points = np.empty((len(starts) * 2, 2))
+        points[0::2, 0] = points[1::2, 0] = columns[starts]
+        points[0::2, 1] = maxima
+        points[1::2, 1] = minima
+        return points
+
+    def _nice_ticks(self, low, high):
+        """Evenly spaced round tick values covering [low, high]."""
+        raw_step = (high - low) / (self.TICKS - 1)
+        magnitude = 10 ** math.floor(math.log10(raw_step))
+        step = next(
+            m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw_step
+        )
+        first = math.floor(low / step) * step
+        ticks = [first]
+        while ticks[-1] < high:
+            ticks.append(ticks[-1] + step)
+        return ticks
+
+    def _format(self, value):
+        if float(value).is_integer():
+            return f"{int(value):,}"
+        # Ticks are round, so two decimals cover steps like 0.25
+        return f"{value:,.2f}".rstrip("0")
+
+    def _draw_axes(self, x_ticks, y_ticks, t0, t1, y0, y1):
+        plot = self.plot_rect
+        for tick in y_ticks:
+            if not y0 <= tick <= y1:
+                continue
+            y = plot.bottom - 1 - (tick - y0) / (y1 - y0) * (plot.height - 1)
+            label = helper.render_text(
+                self.font, self._format(tick), True, Colors.bg_color
+            )
+            self.surface.blit(label, label.get_rect(midright=(plot.left - 4, y)))
+
+        for tick in x_ticks:
+            if not t0 <= tick <= t1:
+                continue
+            x = plot.left + (tick - t0) / (t1 - t0) * (plot.width - 1)
+            label = helper.render_text(
+                self.font, self._format(tick), True, Colors.bg_color
+            )
+            self.surface.blit(label, label.get_rect(midtop=(x, plot.bottom + 4)))
+
+        pygame.draw.rect(self.surface, Colors.bg_color, plot, 1)
@@ -1,15 +1,25 @@
+import math
 import os
 from re import S
 import sys
 
+import numpy as np
 import pygame
 
 from src import helper
-from src.config import Colors, Fonts, image_assets
+from src.config import (
+    ENV_OFFSET_X,
+    ENV_OFFSET_Y,
+    LOW_DETAIL_THRESHOLD,
+    Colors,
+    Fonts,
+)
 from src.enums import Attributes, EventType, MessagePacket, Pages, SurfDesc
+from src.handlers import assets
 from src.handlers.organisms import Counter
+from src.components.camera import Camera
+from src.components.chart import LineChart
 import webbrowser
-import pygame_chart as pyc
 
 
 class HomeComponent:
@@ -19,9 +29,7 @@ class HomeComponent:
 
         self.surface = main_surface
         # self.surface = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        self.env_title = pygame.image.load(
-            os.path.join(image_assets, "home", "env_title.svg")
-        )
+        self.env_title = assets.load_image("home", "env_title.svg")
         self.env_title_rect = self.env_title.get_rect(topleft=(50, 50))
 
         self.components = [
@@ -60,22 +68,27 @@ class HomeComponent:
                 "clicked": True,
                 "x_position": 125,
             },
+            "fast_forward": {
+                "name": "fast_forward",
+                SurfDesc.SURFACE: os.path.join("home", "fast_forward_button.svg"),
+                SurfDesc.CLICKED_SURFACE: os.path.join(
+                    "home", "fast_forward_button_clicked.svg"
+                ),
+                "clicked": False,
+                "x_position": 175,
+            },
         }
 
-        self.close_window_button = pygame.image.load(
-            os.path.join(image_assets, "home", "close_window_button.svg")
-        )
+        self.close_window_button = assets.load_image("home", "close_window_button.svg")
         self.close_window_button_rect = self.close_window_button.get_rect(
             topright=(screen_width, 0)
         )
 
         y = screen_height - 75
         for _, button_data in self.time_control_buttons.items():
-            default_button = pygame.image.load(
-                os.path.join(image_assets, button_data.pop(SurfDesc.SURFACE))
-            )
-            clicked_button = pygame.image.load(
-                os.path.join(image_assets, button_data.pop(SurfDesc.CLICKED_SURFACE))
+            default_button = assets.load_image(button_data.pop(SurfDesc.SURFACE))
+            clicked_button = assets.load_image(
+                button_data.pop(SurfDesc.CLICKED_SURFACE)
             )
             button_rect = default_button.get_rect(
                 center=(button_data.pop("x_position"), y)
@@ -91,12 +104,20 @@ class HomeComponent:
                 }
             )
 
-        self.counter_surface = pygame.Surface((300, 35), pygame.SRCALPHA)
-        self.counter_font = pygame.font.Font(Fonts.PixelifySansMedium, 35)
+        self.counter_surface = pygame.Surface((700, 35), pygame.SRCALPHA)
+        self.counter_font = helper.get_font(Fonts.PixelifySansMedium, 35)
         self.counter_rect = self.counter_surface.get_rect(
-            topleft=(160, screen_height - 90)
+            topleft=(210, screen_height - 90)
         )
 
+        # Chrome that never changes, only repainted under dirty regions
+        self.static_layers = [
+            (self.close_window_button, self.close_window_button_rect),
+            (self.env_title, self.env_title_rect),
+        ]
+        # What each dynamic region currently shows, empty until the first frame
+        self.drawn = {}
+
         self._initialize_screen(context)
 
     def _initialize_screen(self, context):
@@ -134,80 +155,368 @@ class HomeComponent:
         )
 
     def update(self, context=None):
+        """Redraws the regions whose content changed and returns them."""
+        dirty_rects = []
+        if not self.drawn:
+            dirty_rects.append(self.surface.get_rect())
+
+        for component in self.components:
+            handler = component["rendered_handler"]
+            rect = handler.surface.get_rect(**component["position"])
+            component["rect"] = rect
+            for dirty_rect in handler.update(context=context):
+                dirty_rects.append(dirty_rect.move(rect.topleft))
+
         if context.get("paused"):
-            self.time_control_buttons["pause_time"]["clicked"] = True
-            self.time_control_buttons["play_time"]["clicked"] = False
+            active_button = "pause_time"
+        elif context.get("fast_forward"):
+            active_button = "fast_forward"
         else:
-            self.time_control_buttons["pause_time"]["clicked"] = False
-            self.time_control_buttons["play_time"]["clicked"] = True
+            active_button = "play_time"
+        if self.drawn.get("active_button") != active_button:
+            self.drawn["active_button"] = active_button
+            for button, button_data in self.time_control_buttons.items():
+                button_data["clicked"] = button == active_button
+                dirty_rects.append(button_data[SurfDesc.RECT])
+
+        counter_text = f"{context['time']:,} Ts"
+        if context.get("fast_forward") and not context.get("paused"):
+            speed = context.get("speed")
+            speed_text = "MAX" if speed is None else f"{speed}x"
+            counter_text += (
+                f"  {speed_text} @ {context.get('ticks_per_second', 0):,.0f} Ts/s"
+            )
+        if self.drawn.get("counter_text") != counter_text:
+            self.drawn["counter_text"] = counter_text
+            self.counter_surface.fill((0, 0, 0, 0))
+            text = helper.render_text(
+                self.counter_font, counter_text, True, Colors.primary
+            )
+            text_rect = text.get_rect(topleft=(0, 0))
+            self.counter_surface.blit(text, text_rect)
+            dirty_rects.append(self.counter_rect)
+
+        for dirty_rect in dirty_rects:
+            self._compose(dirty_rect)
+        return dirty_rects
+
+    def _compose(self, rect):
+        """Repaints every layer over rect, bottom to top, clipped to rect."""
+        self.surface.set_clip(rect)
+        self.surface.fill(Colors.bg_color)
 
         for component in self.components:
-            component["rendered_handler"].update(context=context)
-            rect = component["rendered_handler"].surface.get_rect(
-                **component["position"]
+            self.surface.blit(
+                component["rendered_handler"].surface, component["rect"]
             )
-            self.surface.blit(component["rendered_handler"].surface, dest=rect)
 
-        self.surface.blit(self.close_window_button, self.close_window_button_rect)
-        self.surface.blit(self.env_title, self.env_title_rect)
+        for layer, layer_rect in self.static_layers:
+            self.surface.blit(layer, layer_rect)
 
         for button_data in self.time_control_buttons.values():
-            if button_data["clicked"]:
-                self.surface.blit(
-                    button_data[SurfDesc.SURFACE]["clicked"], button_data[SurfDesc.RECT]
-                )
-            else:
-                self.surface.blit(
-                    button_data[SurfDesc.SURFACE]["default"], button_data[SurfDesc.RECT]
-                )
+            state = "clicked" if button_data["clicked"] else "default"
+            self.surface.blit(
+                button_data[SurfDesc.SURFACE][state], button_data[SurfDesc.RECT]
+            )
 
-        self.counter_surface.fill((0, 0, 0, 0))
-        text = self.counter_font.render(f"{context['time']:,} Ts", True, Colors.primary)
-        text_rect = text.get_rect(topleft=(0, 0))
-        self.counter_surface.blit(text, text_rect)
         self.surface.blit(self.counter_surface, self.counter_rect)
+        self.surface.set_clip(None)
 
 
 class EnvComponent:
+    # Room around the view for sprites (a swordling's defense) that stick
+    # out of their critter's rect
+    CULL_MARGIN = 20
+    # Sprites come back once the count in view falls this far below the
+    # threshold, so hovering around it doesn't flicker between modes
+    LOW_DETAIL_HYSTERESIS = 0.8
+    # Side of the square plotted per entity in low detail
+    DOT_SIZE = 2
+
     def __init__(self, main_surface, context=None):
-        self.env_image = pygame.image.load(
-            os.path.join(image_assets, "home", "dot_grid.svg")
-        )
+        self.env_image = assets.load_image("home", "dot_grid.svg")
         self.surface = pygame.Surface(
             (self.env_image.get_width(), self.env_image.get_height())
         )
         self.surface.blit(self.env_image, (0, 0))
-        self.plants = []
-        self.critters = []
+        self.rect = self.surface.get_rect(topleft=(ENV_OFFSET_X, ENV_OFFSET_Y))
+        self.critter_grid = None
+        self.drawn_time = None
+        self.low_detail = False
+
+        # Set up on the first frame, once the world's size is known
+        self.camera = None
+        self.panning = False
+        self.drawn_camera = None
+        self.background = pygame.Surface(self.surface.get_size())
+        self.scaled_zoom = None
+        self.scaled_sprites = {}  # sprite -> sprite at scaled_zoom
+
+        # Visible plants drawn once and kept up to date from the forest's changes
+        self.plant_layer = pygame.Surface(self.surface.get_size(), pygame.SRCALPHA)
+        self.plant_layer_forest = None
+        self.plant_layer_camera = None
+        self.drawn_plants = {}  # plant -> view rect it was drawn at
 
     def event_handler(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            for critter in self.critters:
-                if critter.interaction_rect.collidepoint(event.pos):
+        if self.camera is None:
+            return
+
+        if event.type == pygame.MOUSEBUTTONDOWN and self.rect.collidepoint(event.pos):
+            if event.button == 1:
+                critter = self.get_critter_at(event.pos)
+                if critter is not None:
                     return MessagePacket(
                         EventType.NAVIGATION,
                         Pages.PROFILE,
                         context={"id": critter.id},
                     )
+            elif event.button in (2, 3):
+                self.panning = True
+
+        elif event.type == pygame.MOUSEBUTTONUP and event.button in (2, 3):
+            self.panning = False
+
+        elif event.type == pygame.MOUSEMOTION and self.panning:
+            self.camera.pan(-event.rel[0], -event.rel[1])
+
+        elif event.type == pygame.MOUSEWHEEL:
+            position = pygame.mouse.get_pos()
+            if self.rect.collidepoint(position):
+                self.camera.zoom_at(self.to_view(position), Camera.ZOOM_STEP**event.y)
+
+    def to_view(self, position):
+        return position[0] - self.rect.x, position[1] - self.rect.y
+
+    def get_world_position(self, position):
+        """World point under a screen position, None when it's off the env."""
+        if self.camera is None or not self.rect.collidepoint(position):
+            return None
+        return self.camera.view_to_world(self.to_view(position))
+
+    def get_critter_at(self, position):
+        """The critter nearest to a clicked screen position, if one is in reach."""
+        x, y = self.get_world_position(position)
+        # Small critters stay clickable when zoomed out
+        reach = 6 / self.camera.zoom
+        best, best_distance = None, math.inf
+        around = pygame.Rect(0, 0, reach * 2, reach * 2)
+        around.center = (x, y)
+        for critter in self.critter_grid.query(around):
+            cx, cy = critter.rect.center
+            half = max(critter.interaction_rect.width / 2, reach)
+            if abs(cx - x) > half or abs(cy - y) > half:
+                continue
+            distance = math.hypot(cx - x, cy - y)
+            if distance < best_distance:
+                best, best_distance = critter, distance
+        return best
 
     def update(self, context=None):
-        self.plants = context.get("plants")
-        self.critters = context.get("critters")
+        self.critter_grid = context.get("critter_grid")
+        world = context.get("world")
+        if self.camera is None or self.camera.world_size != world.get_size():
+            self.camera = Camera(self.surface.get_size(), world.get_size())
+
+        # The world only changes when the simulation ticks or the camera moves
+        if (context.get("time"), self.camera.version) == (
+            self.drawn_time,
+            self.drawn_camera,
+        ):
+            return []
+        self.drawn_time = context.get("time")
 
-        self.surface.fill(Colors.bg_color)
-        self.surface.blit(self.env_image, (0, 0))
+        if self.drawn_camera != self.camera.version:
+            self.drawn_camera = self.camera.version
+            self.update_background()
+
+        forest = context.get("forest")
+        critter_state = context.get("critter_state")
+        culled = self.camera.world_rect.inflate(
+            self.CULL_MARGIN * 2, self.CULL_MARGIN * 2
+        )
 
-        for critter in self.critters:
-            critter.draw(self.surface)
+        n = len(critter_state)
+        in_view = self.count_inside(
+            culled, critter_state.arrays["position"][:n]
+        ) + self.count_inside(culled, forest.get_plant_arrays()[0])
+        threshold = LOW_DETAIL_THRESHOLD
+        if self.low_detail:
+            threshold *= self.LOW_DETAIL_HYSTERESIS
+        self.low_detail = in_view > threshold
+
+        self.surface.blit(self.background, (0, 0))
+        if self.low_detail:
+            self.draw_low_detail(critter_state, forest)
+            return [self.surface.get_rect()]
+
+        self.update_plant_layer(forest)
+
+        # Only critters whose rects reach into the view are drawn, in
+        # population order so overlaps stack the same from tick to tick
+        visible = sorted(
+            self.critter_grid.query(culled), key=lambda critter: critter._index
+        )
+        helper.blit_many(
+            self.surface,
+            [self.get_critter_blit(critter) for critter in visible if critter.alive],
+        )
+
+        self.surface.blit(self.plant_layer, (0, 0))
+
+        return [self.surface.get_rect()]
+
+    @staticmethod
+    def count_inside(rect, positions):
+        xs, ys = positions[:, 0], positions[:, 1]
+        return np.count_nonzero(
+            (xs >= rect.left)
+            & (xs < rect.right)
+            & (ys >= rect.top)
+            & (ys < rect.bottom)
+        )
+
+    def draw_low_detail(self, critter_state, forest):
+        """Plots every critter, then every plant, as a dot of its color."""
+        # The plant layer stops following changes, so rebuild it on return
+        forest.pop_plant_changes()
+        self.plant_layer_camera = None
+
+        pixels = pygame.surfarray.pixels3d(self.surface)
+        n = len(critter_state)
+        self.plot(
+            pixels,
+            critter_state.arrays["position"][:n],
+            critter_state.arrays["color"][:n],
+        )
+        self.plot(pixels, *forest.get_plant_arrays())
+        del pixels  # Unlocks the surface
+
+    def plot(self, pixels, positions, colors):
+        """Writes a DOT_SIZE square of colors[i] centered on each world position."""
+        camera = self.camera
+        size = self.DOT_SIZE
+        width, height = pixels.shape[:2]
+
+        xs = np.rint((positions[:, 0] - camera.x) * camera.zoom).astype(np.int64)
+        ys = np.rint((positions[:, 1] - camera.y) * camera.zoom).astype(np.int64)
+        xs -= size // 2
+        ys -= size // 2
+        inside = (xs >= 0) & (xs <= width - size) & (ys >= 0) & (ys <= height - size)
+        xs, ys, colors = xs[inside], ys[inside], colors[inside]
+
+        for dx in range(size):
+            for dy in range(size):
+                pixels[xs + dx, ys + dy] = colors
+
+    def update_background(self):
+        """Redraws the dot grid, tiled over the world, for the current camera."""
+        camera = self.camera
+        self.background.fill(Colors.bg_color)
+        tile_width, tile_height = self.env_image.get_size()
+        visible = camera.world_rect.clip(pygame.Rect((0, 0), camera.world_size))
+
+        for tile_x in range(
+            visible.left // tile_width * tile_width, visible.right, tile_width
+        ):
+            for tile_y in range(
+                visible.top // tile_height * tile_height, visible.bottom, tile_height
+            ):
+                area = visible.clip(
+                    pygame.Rect(tile_x, tile_y, tile_width, tile_height)
+                )
+                dest = camera.world_rect_to_view(area)
+                tile = self.env_image.subsurface(area.move(-tile_x, -tile_y))
+                if dest.size != area.size:
+                    tile = pygame.transform.smoothscale(tile, dest.size)
+                self.background.blit(tile, dest)
+
+    def get_critter_blit(self, critter):
+        """(sprite, view position) drawing the critter through the camera."""
+        sprite, (x, y) = critter.get_blit()
+        camera = self.camera
+        if camera.zoom == 1:
+            return sprite, camera.world_to_view((x, y))
+
+        scaled = self.get_scaled(sprite)
+        cx, cy = camera.world_to_view(critter.rect.center)
+        half = scaled.get_width() // 2
+        return scaled, (cx - half, cy - half)
+
+    def get_plant_blit(self, plant):
+        """(sprite, view rect) drawing the plant through the camera."""
+        sprite = plant.image if self.camera.zoom == 1 else self.get_scaled(plant.image)
+        rect = sprite.get_rect(center=self.camera.world_to_view(plant.rect.center))
+        return sprite, rect
+
+    def get_scaled(self, sprite):
+        """Sprite at the camera's zoom, scaled once per zoom level."""
+        zoom = self.camera.zoom
+        if zoom != self.scaled_zoom:
+            self.scaled_zoom = zoom
+            self.scaled_sprites = {}
+
+        scaled = self.scaled_sprites.get(sprite)
+        if scaled is None:
+            width, height = sprite.get_size()
+            scaled = self.scaled_sprites[sprite] = pygame.transform.smoothscale(
+                sprite, (max(1, round(width * zoom)), max(1, round(height * zoom)))
+            )
+        return scaled
+
+    def update_plant_layer(self, forest):
+        """Redraws only the visible plants the forest added, removed or moved."""
+        changed = forest.pop_plant_changes()
+        if (
+            changed is None
+            or forest is not self.plant_layer_forest
+            or self.camera.version != self.plant_layer_camera
+        ):
+            self.plant_layer_forest = forest
+            self.plant_layer_camera = self.camera.version
+            self.plant_layer.fill((0, 0, 0, 0))
+            self.drawn_plants = {}
+            changed = forest.get_plants_in(
+                self.camera.world_rect.inflate(self.CULL_MARGIN, self.CULL_MARGIN)
+            )
+
+        # Wipe where changed plants were, then repaint every plant still there
+        cleared = []
+        for plant in changed:
+            rect = self.drawn_plants.pop(plant, None)
+            if rect is not None:
+                self.plant_layer.fill((0, 0, 0, 0), rect)
+                cleared.append(rect)
+
+        view = self.plant_layer.get_rect()
+        repaint = {
+            plant
+            for rect in cleared
+            for plant in forest.get_plants_in(
+                self.camera.view_rect_to_world(rect).inflate(2, 2)
+            )
+        }
+        repaint.update(plant for plant in changed if forest.has_plant(plant))
 
-        for plant in self.plants:
-            plant.draw(self.surface)
+        blits = []
+        for plant in repaint:
+            sprite, rect = self.get_plant_blit(plant)
+            if rect.colliderect(view):
+                blits.append((sprite, rect))
+                self.drawn_plants[plant] = rect
+        helper.blit_many(self.plant_layer, blits)
 
 
 class SidebarComponent:
+    # Milliseconds between sidebar redraws while fast-forwarding
+    FAST_FORWARD_REFRESH = 500
+
     def __init__(self, main_surface, context=None):
         self.main_surface = main_surface
         self.surface = pygame.Surface((408, 988), pygame.SRCALPHA)
+        self.last_redraw = 0
+        # Everything the current drawing depends on, see get_drawn_state
+        self.drawn_state = None
 
         self.DEFAULT = "default"
         self.SHOW_GRAPHS = "show_graphs"
@@ -220,21 +529,15 @@ class SidebarComponent:
             "screens": [self.DEFAULT, self.SHOW_GRAPHS, self.PROFILE],
             self.DEFAULT: {
                 "function": self.setup_default_sidebar,
-                SurfDesc.SURFACE: pygame.image.load(
-                    os.path.join(image_assets, "home", "sidebar.svg")
-                ),
+                SurfDesc.SURFACE: assets.load_image("home", "sidebar.svg"),
             },
             self.SHOW_GRAPHS: {
                 "function": self.setup_graph_sidebar,
-                SurfDesc.SURFACE: pygame.image.load(
-                    os.path.join(image_assets, "graphs", "main.svg")
-                ),
+                SurfDesc.SURFACE: assets.load_image("graphs", "main.svg"),
             },
             self.PROFILE: {
                 "function": self.setup_profile_sidebar,
-                SurfDesc.SURFACE: pygame.image.load(
-                    os.path.join(image_assets, "profile", "main.svg")
-                ),
+                SurfDesc.SURFACE: assets.load_image("profile", "main.svg"),
             },
         }
 
@@ -242,12 +545,8 @@ class SidebarComponent:
         self.surface.blit(self.sidebar_screens[self.PROFILE][SurfDesc.SURFACE], (0, 0))
 
         # Back button setup
-        back_button = pygame.image.load(
-            os.path.join(image_assets, "graphs", "back_button.svg")
-        )
-        back_button_clicked = pygame.image.load(
-            os.path.join(image_assets, "graphs", "back_button_clicked.svg")
-        )
+        back_button = assets.load_image("graphs", "back_button.svg")
+        back_button_clicked = assets.load_image("graphs", "back_button_clicked.svg")
         back_button_rect = back_button.get_rect(center=(50, 50))
 
         self.sidebar_screens[self.PROFILE].update(
@@ -307,8 +606,11 @@ class SidebarComponent:
             Attributes.MAX_LIFESPAN,
         ]:
             value = critter_data.get(key, None)
-            key_surface = pygame.font.Font(Fonts.PixelifySans, 18).render(
-                helper.limit_text_size(key.value, 14), True, Colors.bg_color
+            key_surface = helper.render_text(
+                helper.get_font(Fonts.PixelifySans, 18),
+                helper.limit_text_size(key.value, 14),
+                True,
+                Colors.bg_color,
             )
             key_rect = key_surface.get_rect(topleft=(options_x, y))
 
@@ -326,8 +628,11 @@ class SidebarComponent:
                     }
                 )
 
-            value_text_surface = pygame.font.Font(Fonts.PixelifySans, 18).render(
-                str(value), True, Colors.primary
+            value_text_surface = helper.render_text(
+                helper.get_font(Fonts.PixelifySans, 18),
+                str(value),
+                True,
+                Colors.primary,
             )
             value_surface.blit(value_text_surface, (10, 5))
 
@@ -339,15 +644,8 @@ class SidebarComponent:
     def __setup_critter_head(self, critter_data):
         dp_center = (self.surface.get_width() // 2, 175)
 
-        # Load circle image once
-        self.sidebar_screens[self.PROFILE]["dp_circle"] = self.sidebar_screens[
-            self.PROFILE
-        ].get("dp_circle") or pygame.image.load(
-            os.path.join(image_assets, "profile", "dp_circle.svg")
-        )
-
         # Center the circle image
-        dp_circle_image = self.sidebar_screens[self.PROFILE]["dp_circle"]
+        dp_circle_image = assets.load_image("profile", "dp_circle.svg")
         circle_rect = dp_circle_image.get_rect(center=dp_center)
         self.surface.blit(dp_circle_image, circle_rect)
 
@@ -357,8 +655,8 @@ class SidebarComponent:
         self.surface.blit(creature_image, creature_rect)
 
         species = critter_data.get(Attributes.SPECIES)
-        species_name_surface = pygame.font.Font(Fonts.PixelifySansBold, 30).render(
-            species, True, Colors.bg_color
+        species_name_surface = helper.render_text(
+            helper.get_font(Fonts.PixelifySansBold, 30), species, True, Colors.bg_color
         )
         species_name_rect = species_name_surface.get_rect(topleft=(35, 310))
         self.surface.blit(species_name_surface, species_name_rect)
@@ -366,8 +664,8 @@ class SidebarComponent:
         critter_id = str(critter_data.get(Attributes.ID)).upper()
         y = 350
         for text in helper.split_word(critter_id, 30):
-            critter_id_surface = pygame.font.Font(Fonts.PixelifySans, 18).render(
-                text, True, Colors.bg_color
+            critter_id_surface = helper.render_text(
+                helper.get_font(Fonts.PixelifySans, 18), text, True, Colors.bg_color
             )
             critter_id_rect = critter_id_surface.get_rect(topleft=(35, y))
             self.surface.blit(critter_id_surface, critter_id_rect)
@@ -379,24 +677,22 @@ class SidebarComponent:
         )
 
         # Back button setup
-        back_button = pygame.image.load(
-            os.path.join(image_assets, "graphs", "back_button.svg")
-        )
-        back_button_clicked = pygame.image.load(
-            os.path.join(image_assets, "graphs", "back_button_clicked.svg")
-        )
+        back_button = assets.load_image("graphs", "back_button.svg")
+        back_button_clicked = assets.load_image("graphs", "back_button_clicked.svg")
         back_button_rect = back_button.get_rect(center=(50, 50))
 
-        # Create Population Graph Figure
-        population_figure = pyc.Figure(
-            self.surface, 15, 120, 380, 200, bg_color=Colors.white
-        )
-        fitness_figure = pyc.Figure(
-            self.surface, 15, 375, 380, 200, bg_color=Colors.white
-        )
-        plant_abundance_figure = pyc.Figure(
-            self.surface, 15, 630, 380, 200, bg_color=Colors.white
-        )
+        # Charts redraw from the history only when it gains a sample
+        graphs = {
+            name: {
+                "chart": LineChart((380, 200), bg_color=Colors.white),
+                SurfDesc.RECT: pygame.Rect(15, y, 380, 200),
+            }
+            for name, y in [
+                ("population_graph", 120),
+                ("fitness_graph", 375),
+                ("plant_abundance_graph", 630),
+            ]
+        }
 
         self.sidebar_screens[self.SHOW_GRAPHS].update(
             {
@@ -406,9 +702,7 @@ class SidebarComponent:
                     SurfDesc.CLICKED_SURFACE: back_button_clicked,
                     SurfDesc.RECT: back_button_rect,
                 },
-                "population_graph": population_figure,
-                "fitness_graph": fitness_figure,
-                "plant_abundance_graph": plant_abundance_figure,
+                **graphs,
             }
         )
 
@@ -582,10 +876,8 @@ class SidebarComponent:
                 return MessagePacket(EventType.NAVIGATION, Pages.HOME)
 
     def load_and_store_button(self, name, image, clicked_image, position):
-        button_image = pygame.image.load(os.path.join(image_assets, image))
-        clicked_button_image = pygame.image.load(
-            os.path.join(image_assets, clicked_image)
-        )
+        button_image = assets.load_image(image)
+        clicked_button_image = assets.load_image(clicked_image)
         button_rect = button_image.get_rect(center=position)
         # Blit button to the sidebar
         self.surface.blit(button_image, button_rect)
@@ -599,7 +891,59 @@ class SidebarComponent:
             }
         )
 
+    def needs_redraw(self, context):
+        """Fast-forwarded frames keep the last sidebar unless its screen changes."""
+        now = pygame.time.get_ticks()
+        switching = self.sidebar_screens["update"] or (
+            (context.get("selected_critter") is not None)
+            != (self.sidebar_screens[SurfDesc.CURRENT_SURFACE] == self.PROFILE)
+        )
+        if (
+            not context.get("fast_forward")
+            or switching
+            or now - self.last_redraw >= self.FAST_FORWARD_REFRESH
+        ):
+            self.last_redraw = now
+            return True
+        return False
+
+    def get_drawn_state(self, context):
+        """Snapshot of the inputs to the current screen, equal means unchanged."""
+        current = self.sidebar_screens[SurfDesc.CURRENT_SURFACE]
+        selected_critter = context.get("selected_critter")
+        state = (current, self.sidebar_screens["update"], selected_critter is not None)
+
+        if selected_critter is not None:
+            back_button = self.sidebar_screens[self.PROFILE].get("back_button", {})
+            return state + (
+                tuple(selected_critter.values()),
+                back_button.get(SurfDesc.CURRENT_SURFACE),
+            )
+        elif current == self.SHOW_GRAPHS:
+            back_button = self.sidebar_screens[self.SHOW_GRAPHS].get("back_button", {})
+            # Graphs only change when a sample is taken
+            return state + (
+                len(context.get("population_history")),
+                len(context.get("plant_history")),
+                back_button.get(SurfDesc.CURRENT_SURFACE),
+            )
+        return state + (
+            len(context.get("critters")),
+            len(context.get("dead_critters")),
+            tuple(
+                button[SurfDesc.CURRENT_SURFACE]
+                for button in getattr(self, "buttons", {}).values()
+            ),
+        )
+
     def update(self, context=None):
+        """Redraws the sidebar if anything it shows changed; returns the dirty rects."""
+        if not self.needs_redraw(context):
+            return []
+        state = self.get_drawn_state(context)
+        if state == self.drawn_state:
+            return []
+
         if context.get("selected_critter", None) is not None:
             if self.sidebar_screens[SurfDesc.CURRENT_SURFACE] != self.PROFILE:
                 self.sidebar_screens[self.PROFILE]["function"](context=context)
@@ -618,6 +962,10 @@ class SidebarComponent:
                 self.sidebar_screens["update"] = False
             self.update_default_sidebar(context)
 
+        # Drawing may have switched screens, so snapshot what is now shown
+        self.drawn_state = self.get_drawn_state(context)
+        return [self.surface.get_rect()]
+
     def update_default_sidebar(self, context):
         alive = len(context.get("critters"))
         dead = len(context.get("dead_critters"))
@@ -645,86 +993,32 @@ class SidebarComponent:
         self.update_plant_abundance_graph(context)
 
     def update_population_graph(self, context):
-        figure = self.sidebar_screens[self.SHOW_GRAPHS].get("population_graph")
-        population_history = context.get("population_history", [])
-        species_colors = context.get("species_colors", {})
-
-        time_steps, critter_counts = zip(*population_history)
-        time_steps = list(time_steps)
-
-        # Extract total population
-        total_population = [c["total"] for c in critter_counts]
-        if sum(total_population) == 0:
-            return  # No data, don't attempt to draw
-
-        species_keys = {
-            species for c in critter_counts for species in c if species != "total"
-        }
-
-        figure.chart_names = []
-        figure.charts = []
-
-        # Plot total population
-        figure.line(
-            "Total Population", time_steps, total_population, color=Colors.bg_color
+        self.__update_graph(
+            "population_graph",
+            context.get("population_history"),
+            context.get("species_colors", {}),
         )
 
-        # Plot each species separately
-        for species in species_keys:
-            species_population = [c.get(species, 0) for c in critter_counts]
-            species_color = species_colors.get(
-                species, (255, 255, 255)
-            )  # Default white if not found
-            figure.line(
-                f"Species {species}",
-                time_steps,
-                species_population,
-                color=species_color,
-            )
-
-        figure.draw()
-
     def update_fitness_graph(self, context):
-        figure = self.sidebar_screens[self.SHOW_GRAPHS].get("fitness_graph")
-        fitness_history = context.get("fitness_history", [])
-        time_steps, fitness_values = zip(*fitness_history)
-
-        time_steps = list(time_steps)
-        total_fitness = [f["total"] for f in fitness_values]
-        if sum(total_fitness) == 0:
-            return
-
-        species_keys = {
-            species for f in fitness_values for species in f if species != "total"
-        }
-
-        figure.chart_names = []
-        figure.charts = []
-
-        figure.line("Total Fitness", time_steps, total_fitness, color=Colors.bg_color)
-
-        for species in species_keys:
-            species_fitness = [f.get(species, 0) for f in fitness_values]
-            species_color = context.get("species_colors", {}).get(
-                species, (255, 255, 255)
-            )
-            figure.line(
-                f"Species {species}", time_steps, species_fitness, color=species_color
-            )
-
-        figure.draw()
+        self.__update_graph(
+            "fitness_graph",
+            context.get("fitness_history"),
+            context.get("species_colors", {}),
+        )
 
     def update_plant_abundance_graph(self, context):
-        figure = self.sidebar_screens[self.SHOW_GRAPHS].get("plant_abundance_graph")
-        time_steps, population_values = map(list, zip(*context.get("plant_history")))
+        self.__update_graph("plant_abundance_graph", context.get("plant_history"))
 
-        figure.chart_names = []
-        figure.charts = []
+    def __update_graph(self, name, history, species_colors=None):
+        graph = self.sidebar_screens[self.SHOW_GRAPHS][name]
+        chart = graph["chart"]
 
-        figure.line(
-            "Plant Abundance", time_steps, population_values, color=Colors.bg_color
-        )
-        figure.draw()
+        chart.set_color("total", Colors.bg_color)
+        for species, color in (species_colors or {}).items():
+            chart.set_color(species, color)
+
+        chart.draw(history)
+        self.surface.blit(chart.surface, graph[SurfDesc.RECT])
 
     def update_profile_sidebar(self, context):
         # TODO: Clean this
@@ -749,8 +1043,11 @@ class SidebarComponent:
             value_rect = dynamic_options[key][SurfDesc.RECT]
             value_surface.fill(Colors.bg_color)
 
-            value_text_surface = pygame.font.Font(Fonts.PixelifySans, 18).render(
-                str(value), True, Colors.primary
+            value_text_surface = helper.render_text(
+                helper.get_font(Fonts.PixelifySans, 18),
+                str(value),
+                True,
+                Colors.primary,
             )
             value_surface.blit(value_text_surface, (10, 5))
 
@@ -1,5 +1,4 @@
 from enum import Enum
-import os
 import re
 import uuid
 
@@ -7,7 +6,7 @@ import numpy as np
 import pygame
 import pygame.gfxdraw
 
-from src.config import Colors, Fonts, InvalidConnection, image_assets
+from src.config import Colors, Fonts, InvalidConnection
 from src.enums import (
     Attributes,
     Defence,
@@ -18,6 +17,7 @@ from src.enums import (
     SurfDesc,
     Shapes,
 )
+from src.handlers import assets
 from src.handlers.genetics import NeuronManager
 import src.helper as helper
 
@@ -29,9 +29,7 @@ class Components(Enum):
 class LaboratoryComponent:
     def __init__(self, main_surface, context=None):
         self.main_surface = main_surface
-        self.bg_image = pygame.image.load(
-            os.path.join(image_assets, "laboratory", "laboratory_bg.svg")
-        )
+        self.bg_image = assets.load_image("laboratory", "laboratory_bg.svg")
         self.user_inputs = {}
         self.surface = pygame.Surface(size=(self.bg_image.get_size()))
         self.surface_x_offset = (
@@ -64,6 +62,8 @@ class LaboratoryComponent:
         sub_component = self.sub_comp_states[self.curr_sub_comp]
         sub_component.update(context)
         self.surface.blit(sub_component.surface, (0, 0))
+        # The lab animates, so the whole panel changes every frame
+        return [self.surface.get_rect()]
 
     def event_handler(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -120,11 +120,9 @@ class LaboratoryComponent:
             SurfDesc.CURRENT_SURFACE: None,
             "position": {"topleft": (50, 50)},
             SurfDesc.ABSOLUTE_RECT: None,
-            SurfDesc.SURFACE: pygame.image.load(
-                os.path.join(image_assets, "laboratory", "back_button.svg")
-            ),
-            SurfDesc.CLICKED_SURFACE: pygame.image.load(
-                os.path.join(image_assets, "laboratory", "back_button_clicked.svg")
+            SurfDesc.SURFACE: assets.load_image("laboratory", "back_button.svg"),
+            SurfDesc.CLICKED_SURFACE: assets.load_image(
+                "laboratory", "back_button_clicked.svg"
             ),
         }
 
@@ -153,7 +151,7 @@ class NeuralLab:
         surface = self._setup_surface()
 
         self.surface = surface
-        self.body_font = pygame.font.Font(Fonts.PixelifySansMedium, 21)
+        self.body_font = helper.get_font(Fonts.PixelifySansMedium, 21)
 
         self.selected_neuron = {}
 
@@ -187,8 +185,8 @@ class NeuralLab:
     def _configure_neural_frame(self):
         self.neural_frame = {}
 
-        self.neural_frame[SurfDesc.SURFACE] = pygame.image.load(
-            os.path.join(image_assets, "laboratory", "neural_lab", "neural_frame.svg")
+        self.neural_frame[SurfDesc.SURFACE] = assets.load_image(
+            "laboratory", "neural_lab", "neural_frame.svg"
         )
         self.neural_frame[SurfDesc.RECT] = self.neural_frame[SurfDesc.SURFACE].get_rect(
             topleft=(62, 204)
@@ -228,21 +226,11 @@ class NeuralLab:
     def _configure_unleash_organism_button(self):
         self.unleash_organism_button = {
             SurfDesc.CURRENT_SURFACE: None,
-            SurfDesc.SURFACE: pygame.image.load(
-                os.path.join(
-                    image_assets,
-                    "laboratory",
-                    "neural_lab",
-                    "unleash_organism_button.svg",
-                )
+            SurfDesc.SURFACE: assets.load_image(
+                "laboratory", "neural_lab", "unleash_organism_button.svg"
             ),
-            SurfDesc.CLICKED_SURFACE: pygame.image.load(
-                os.path.join(
-                    image_assets,
-                    "laboratory",
-                    "neural_lab",
-                    "unleash_organism_button_clicked.svg",
-                )
+            SurfDesc.CLICKED_SURFACE: assets.load_image(
+                "laboratory", "neural_lab", "unleash_organism_button_clicked.svg"
             ),
             "position": {"topleft": (1304, 843)},
             SurfDesc.RECT: None,
@@ -540,8 +528,8 @@ class NeuralLab:
         }
 
         # Write name of the neuron on the surface
-        text = self.body_font.render(
-            self.selected_neuron["name"], True, Colors.bg_color
+        text = helper.render_text(
+            self.body_font, self.selected_neuron["name"], True, Colors.bg_color
         )
         surface.blit(text, text.get_rect(center=(radius, radius)))
         selected_surface.blit(text, text.get_rect(center=(radius, radius)))
@@ -710,7 +698,8 @@ class NeuralLab:
             error = self.neural_frame["errors"]
             connection = error["connection"]
             message = helper.split_text(error["message"], 36)
-            text_surface_connection = self.body_font.render(
+            text_surface_connection = helper.render_text(
+                self.body_font,
                 f"{connection[0]['name']} -> {connection[1]['name']}",
                 True,
                 Colors.primary,
@@ -721,7 +710,9 @@ class NeuralLab:
             )
 
             for i, line in enumerate(message):
-                text_surface_message = self.body_font.render(line, True, Colors.primary)
+                text_surface_message = helper.render_text(
+                    self.body_font, line, True, Colors.primary
+                )
                 text_surface.blit(
                     text_surface_message,
                     text_surface_message.get_rect(topleft=(30, 180 + (i * 20))),
@@ -751,14 +742,12 @@ class NeuralLab:
             self.surface, color=Colors.primary, center=(mid_x, mid_y), radius=25
         )
 
-        text = self.body_font.render(connection[2], Colors.bg_color, Colors.bg_color)
+        text = helper.render_text(self.body_font, connection[2], True, Colors.bg_color)
         self.surface.blit(text, text.get_rect(center=(mid_x - 0, mid_y)))
 
     def _setup_surface(self):
         surface = pygame.Surface(
-            size=pygame.image.load(
-                os.path.join(image_assets, "laboratory", "laboratory_bg.svg")
-            ).get_size(),
+            size=assets.load_image("laboratory", "laboratory_bg.svg").get_size(),
             flags=pygame.SRCALPHA,
         )
 
@@ -770,14 +759,12 @@ class NeuralLab:
         ]
 
         for title, pos in titles:
-            title_image = pygame.image.load(
-                os.path.join(image_assets, "laboratory", "neural_lab", title)
-            )
+            title_image = assets.load_image("laboratory", "neural_lab", title)
             surface.blit(title_image, title_image.get_rect(topleft=pos))
 
         self.help_screen = {}
-        self.help_screen[SurfDesc.SURFACE] = pygame.image.load(
-            os.path.join(image_assets, "laboratory", "neural_lab", "help_screen.svg")
+        self.help_screen[SurfDesc.SURFACE] = assets.load_image(
+            "laboratory", "neural_lab", "help_screen.svg"
         )
         self.help_screen[SurfDesc.RECT] = self.help_screen[SurfDesc.SURFACE].get_rect(
             topleft=(1304, 519)
@@ -865,14 +852,14 @@ class NeuralLab:
         normal.fill(Colors.primary)
         pygame.gfxdraw.aacircle(normal, 25, 25, 25, Colors.bg_color)
 
-        text_render = self.body_font.render(text, True, Colors.bg_color)
+        text_render = helper.render_text(self.body_font, text, True, Colors.bg_color)
         normal.blit(text_render, text_render.get_rect(center=(25, 25)))
 
         clicked = pygame.Surface((55, 55))
         clicked.fill(Colors.primary)
         pygame.draw.circle(clicked, Colors.bg_color, (25, 25), 25)
 
-        text_render = self.body_font.render(text, True, Colors.primary)
+        text_render = helper.render_text(self.body_font, text, True, Colors.primary)
         clicked.blit(text_render, text_render.get_rect(center=(25, 25)))
 
         return {"normal": normal, "clicked": clicked}
@@ -884,14 +871,14 @@ class NeuralLab:
         neuron_surface.fill(color=Colors.primary)
         pygame.gfxdraw.aacircle(neuron_surface, 25, 25, 25, Colors.bg_color)
 
-        text = self.body_font.render("H", True, Colors.bg_color)
+        text = helper.render_text(self.body_font, "H", True, Colors.bg_color)
         neuron_surface.blit(text, text.get_rect(center=(25, 25)))
 
         clicked_neuron_surface = pygame.Surface((55, 55))
         clicked_neuron_surface.fill(color=Colors.primary)
         pygame.draw.circle(clicked_neuron_surface, Colors.bg_color, (25, 25), 25)
 
-        text = self.body_font.render("H", True, Colors.primary)
+        text = helper.render_text(self.body_font, "H", True, Colors.primary)
         clicked_neuron_surface.blit(text, text.get_rect(center=(25, 25)))
 
         self.hidden_neuron = {
@@ -918,14 +905,14 @@ class NeuralLab:
         neuron_surface.fill(color=Colors.primary)
         pygame.gfxdraw.aacircle(neuron_surface, 25, 25, 25, Colors.bg_color)
 
-        text = self.body_font.render("B", True, Colors.bg_color)
+        text = helper.render_text(self.body_font, "B", True, Colors.bg_color)
         neuron_surface.blit(text, text.get_rect(center=(25, 25)))
 
         clicked_neuron_surface = pygame.Surface((55, 55))
         clicked_neuron_surface.fill(color=Colors.primary)
         pygame.draw.circle(clicked_neuron_surface, Colors.bg_color, (25, 25), 25)
 
-        text = self.body_font.render("B", True, Colors.primary)
+        text = helper.render_text(self.body_font, "B", True, Colors.primary)
         clicked_neuron_surface.blit(text, text.get_rect(center=(25, 25)))
 
         self.bias_neuron = {
@@ -959,7 +946,9 @@ class NeuralLab:
         desc[SurfDesc.SURFACE].fill(Colors.primary)
         text_y = 0
         for text in neuron_desc_text:
-            text = self.body_font.render(text, True, Colors.bg_color, Colors.primary)
+            text = helper.render_text(
+                self.body_font, text, True, Colors.bg_color, Colors.primary
+            )
             desc[SurfDesc.SURFACE].blit(text, text.get_rect(topleft=(0, text_y)))
             text_y += 25
 
@@ -969,18 +958,14 @@ class AttributesLab:
         self.time = 0
         self.main_surface = main_surface
         self.surface = pygame.Surface(
-            size=(
-                pygame.image.load(
-                    os.path.join(image_assets, "laboratory", "laboratory_bg.svg")
-                ).get_size()
-            ),
+            size=(assets.load_image("laboratory", "laboratory_bg.svg").get_size()),
             flags=pygame.SRCALPHA,
         )
         self.surface_x_offset = context.get("surface_x_offset", 0)
         self.surface_y_offset = context.get("surface_y_offset", 0)
 
-        Components.ATTRS_LAB_text = pygame.image.load(
-            os.path.join(image_assets, "laboratory", "attrs_lab", "lab_intro_text.svg")
+        Components.ATTRS_LAB_text = assets.load_image(
+            "laboratory", "attrs_lab", "lab_intro_text.svg"
         )
         self.surface.blit(
             Components.ATTRS_LAB_text,
@@ -1100,7 +1085,7 @@ class AttributesLab:
         self.MAX_LIFESPAN = "Max Lifespan: "
 
         return {
-            "font": pygame.font.Font(Fonts.PixelifySansMedium, 21),
+            "font": helper.get_font(Fonts.PixelifySansMedium, 21),
             "text_color": pygame.Color(0, 0, 0),
             "bg_color": pygame.Color(74, 227, 181),
             "yIncrement": 34,
@@ -1185,7 +1170,8 @@ class AttributesLab:
 
         text_surface = pygame.Surface((900, self.traits_schema["highlight_width"]))
         text_surface.fill(self.traits_schema["bg_color"])
-        text = self.traits_schema["font"].render(
+        text = helper.render_text(
+            self.traits_schema["font"],
             option,
             True,
             self.traits_schema["text_color"],
@@ -1230,7 +1216,8 @@ class AttributesLab:
             data += "_"
 
         # Render the text with the appropriate colors
-        text = self.traits_schema["font"].render(
+        text = helper.render_text(
+            self.traits_schema["font"],
             data,
             True,
             self.traits_schema["bg_color"],
@@ -1264,7 +1251,8 @@ class AttributesLab:
                 if hasattr(choice["value"], "value"):
                     data = choice["value"].value
 
-                text = self.traits_schema["font"].render(
+                text = helper.render_text(
+                    self.traits_schema["font"],
                     data,
                     True,
                     (
@@ -1300,18 +1288,11 @@ class AttributesLab:
     def __create_neural_network_button(self):
         self.neural_network_button = {
             SurfDesc.CURRENT_SURFACE: None,
-            SurfDesc.SURFACE: pygame.image.load(
-                os.path.join(
-                    image_assets, "laboratory", "attrs_lab", "neural_network_button.svg"
-                )
+            SurfDesc.SURFACE: assets.load_image(
+                "laboratory", "attrs_lab", "neural_network_button.svg"
             ),
-            SurfDesc.CLICKED_SURFACE: pygame.image.load(
-                os.path.join(
-                    image_assets,
-                    "laboratory",
-                    "attrs_lab",
-                    "neural_network_button_clicked.svg",
-                )
+            SurfDesc.CLICKED_SURFACE: assets.load_image(
+                "laboratory", "attrs_lab", "neural_network_button_clicked.svg"
             ),
             "position": {
                 "topright": (
@@ -1352,15 +1333,11 @@ class AttributesLab:
             "border_angle": 0,
             "update": True,
             Attributes.COLOR: (125, 255, 255),
-            "border_image": pygame.image.load(
-                os.path.join(
-                    image_assets, "laboratory", "attrs_lab", "pic_circle_border.svg"
-                )
+            "border_image": assets.load_image(
+                "laboratory", "attrs_lab", "pic_circle_border.svg"
             ),
-            "bg_image": pygame.image.load(
-                os.path.join(
-                    image_assets, "laboratory", "attrs_lab", "pic_circle_bg.svg"
-                )
+            "bg_image": assets.load_image(
+                "laboratory", "attrs_lab", "pic_circle_bg.svg"
             ),
             "position": {
                 "center": (
@@ -1650,7 +1627,8 @@ class AttributesLab:
         ):
             data += "_"
 
-        text = self.traits_schema["font"].render(
+        text = helper.render_text(
+            self.traits_schema["font"],
             data,
             True,
             self.traits_schema["bg_color"],
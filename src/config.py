@@ -11,9 +11,29 @@ assets = os.path.join(base_path, "assets")
 image_assets = os.path.join(assets, "images")
 font_assets = os.path.join(assets, "fonts")
 
+# Rasterized SVGs are kept here between runs; an empty LIFEOFPY_ASSET_CACHE
+# turns the disk cache off
+ASSET_CACHE_DIR = os.environ.get(
+    "LIFEOFPY_ASSET_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "TheLifeOfPy", "assets"),
+)
+
 ENV_OFFSET_X = 50
 ENV_OFFSET_Y = 100
 
+# Matches assets/images/home/dot_grid.svg, used when running headless
+ENV_WIDTH = 1379
+ENV_HEIGHT = 937
+
+# Critters and plants in view above which the env plots them as pixels
+# instead of blitting sprites
+LOW_DETAIL_THRESHOLD = 5000
+
+# Worker processes scanning critter vision in parallel, 0 to scan serially;
+# below PARALLEL_MIN_CRITTERS the hand-off costs more than it saves
+SIM_WORKERS = int(os.environ.get("LIFEOFPY_WORKERS", 0))
+PARALLEL_MIN_CRITTERS = 2000
+
 
 class Colors:
     bg_color = (26, 26, 26)
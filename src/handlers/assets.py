@@ -0,0 +1,76 @@
+import hashlib
+import os
+
+import pygame
+
+from src.config import ASSET_CACHE_DIR, image_assets
+
+# (path under image_assets, scale) -> shared surface
+images = {}
+
+
+def load_image(*path, scale=1):
+    """
+    Returns the shared surface for an image under assets/images, rasterizing
+    it on first request. Every caller gets the same surface, so blit or copy
+    it, don't draw on it.
+    """
+    key = (os.path.join(*path), scale)
+    image = images.get(key)
+    if image is None:
+        image = images[key] = _load(*key)
+    return image
+
+
+def preload_images():
+    """Rasterizes every SVG up front so screens build without loading any."""
+    for root, _, files in os.walk(image_assets):
+        for name in files:
+            if name.endswith(".svg"):
+                load_image(os.path.relpath(os.path.join(root, name), image_assets))
+
+
+def _load(path, scale):
+    source = os.path.join(image_assets, path)
+    cache_path = None
+    if ASSET_CACHE_DIR and path.endswith(".svg"):
+        # Keyed by content, so edited assets never hit a stale raster
+        with open(source, "rb") as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+        cache_path = os.path.join(ASSET_CACHE_DIR, f"{digest}_{scale}.png")
+
+    if cache_path and os.path.exists(cache_path):
+        try:
+            return _prepare(pygame.image.load(cache_path))
+        except pygame.error:
+            pass  # Unreadable cache entry, rasterize again below
+
+    if scale == 1:
+        image = pygame.image.load(source)
+    elif hasattr(pygame.image, "load_sized_svg") and path.endswith(".svg"):
+        # pygame-ce renders the vector at the target size
+        size = pygame.image.load(source).get_size()
+        image = pygame.image.load_sized_svg(
+            source, (round(size[0] * scale), round(size[1] * scale))
+        )
+    else:
+        image = pygame.transform.smoothscale_by(pygame.image.load(source), scale)
+
+    if cache_path:
+        # Written aside and renamed, so a concurrent run never reads half a file
+        partial_path = f"{cache_path[:-4]}.{os.getpid()}.png"
+        try:
+            os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+            pygame.image.save(image, partial_path)
+            os.replace(partial_path, cache_path)
+        except (OSError, pygame.error):
+            pass  # The cache is only a speed-up
+
+    return _prepare(image)
+
+
+def _prepare(image):
+    # Matching the display's pixel format makes every later blit cheaper
+    if pygame.display.get_surface() is not None:
+        return image.convert_alpha()
+    return image
@@ -6,10 +6,12 @@ import noise
 import numpy as np
 import pygame
 
-from src.config import ENV_OFFSET_X, ENV_OFFSET_Y
 from src.enums import Attributes, Defence, NeuronType, MatingState
 from collections import defaultdict
+from itertools import compress
 import src.helper as helper
+from src.handlers.spatial import SpatialGrid
+from src.config import PARALLEL_MIN_CRITTERS
 
 
 class ConnectionGene:
@@ -26,6 +28,8 @@ class NodeGene:
         self._id = node_id
         self.name = node_name
         self.type = node_type
+        # Bound NeuronManager method for sensors and actuators, set by Genome
+        self.function = None
 
     def __eq__(self, other):
         return self._id == other._id and self.type == other.type
@@ -48,6 +52,7 @@ class Genome:
         self.actuators = []
         self.bias = []
         self.hidden = []
+        self.sensor_functions = []
 
         if genome_data:
             for node_id, node_name, node_type in (
@@ -63,9 +68,28 @@ class Genome:
                     self.node_genes[node_1[0]], self.node_genes[node_2[0]], node_1[3]
                 )
 
-            self.node_inputs, _, self.sorted_nodes, self.node_groups = (
-                self._resolve_nodes(genome_data)
-            )
+            self.node_inputs, _, self.node_groups = self._resolve_nodes(genome_data)
+            self.network = CompiledNetwork(self)
+            self._bind_neurons()
+
+    def _bind_neurons(self):
+        """Resolves sensor and actuator methods once, so ticks make direct calls."""
+        for nodes, known, kind in [
+            (self.sensors, NeuronManager.sensors, "sensor"),
+            (self.actuators, NeuronManager.actuators, "actuator"),
+        ]:
+            for node in nodes:
+                if node.name not in known:
+                    raise ValueError(f"Unknown {kind}: {node.name}")
+
+        if self.neuron_manager is None:
+            return
+
+        for node in self.sensors:
+            node.function = getattr(self.neuron_manager, f"obs_{node.name}")
+        for node in self.actuators:
+            node.function = getattr(self.neuron_manager, f"act_{node.name}")
+        self.sensor_functions = [node.function for node in self.sensors]
 
     def _resolve_nodes(self, genome_data):
         output_map = {node._id: set() for node in self.node_genes.values()}
@@ -82,8 +106,7 @@ class Genome:
             undirected_map[node_2].add(node_1)
 
         node_groups = self.find_connected_nodes(undirected_map)
-        sorted_nodes = [self.node_genes[node_id] for node_id in helper.dfs(output_map)]
-        return input_map, output_map, sorted_nodes, node_groups
+        return input_map, output_map, node_groups
 
     def find_connected_nodes(self, undirected_graph):
         visited = []
@@ -98,15 +121,7 @@ class Genome:
         return components
 
     def observe(self, critter):
-        observations = []
-        for neuron in self.node_genes.values():
-            if neuron.type == NeuronType.SENSOR:
-                if neuron.name in self.neuron_manager.sensors:
-                    sensor_method = getattr(self.neuron_manager, f"obs_{neuron.name}")
-                    observations.append(sensor_method(critter))
-                else:
-                    raise ValueError(f"Unknown sensor: {neuron}")
-        return observations
+        return [sensor(critter) for sensor in self.sensor_functions]
 
     def forward(self, inputs):
         if len(inputs) != len(self.sensors):
@@ -114,73 +129,11 @@ class Genome:
                 f"Expected {len(self.sensors)} inputs, but got {len(inputs)}."
             )
 
-        # Initialize sensor nodes with input values
-        activations = {node._id: value for node, value in zip(self.sensors, inputs)}
-
-        for node in self.node_genes.values():
-            # Initialize bias nodes to 1
-            if node.type == NeuronType.BIAS:
-                activations[node._id] = 1
-            # Initialize other nodes to 0
-            elif node.type != NeuronType.SENSOR:
-                activations[node._id] = 0
-
-        for node in self.sorted_nodes:
-            if node.type in [NeuronType.SENSOR, NeuronType.BIAS]:
-                continue
-
-            value = 0
-            for input_node in self.node_inputs.get(node._id, set()):
-                if conn := self.connection_genes.get((input_node, node._id), None):
-                    if conn.enabled:
-                        value += activations[input_node] * conn.weight
-            activations[node._id] = value
-
-        self.apply_activation(activations)
-
-        return list(filter(lambda node: activations[node._id] == 1, self.actuators))
-
-    def apply_activation(self, activations):
-        """Applies the activation function to the value."""
-        # Uses a winner-takes-all activation function for the output layer
-        for group in self.node_groups:
-            actuators = self._get_nodes_from_id(group, NeuronType.ACTUATOR)
-            if not actuators:
-                continue
-
-            max_value = max(activations[node._id] for node in actuators)
-            if max_value < 0:
-                for node in actuators:
-                    activations[node._id] = 0.0
-            else:
-                for node in actuators:
-                    if activations[node._id] == max_value:
-                        activations[node._id] = 1.0
-                    else:
-                        activations[node._id] = 0.0
-
-    def _get_nodes_from_id(self, node_ids, node_type=None):
-        """Returns a list of nodes from the node_ids."""
-        nodes = []
-        for node_id in node_ids:
-            if node_id in self.node_genes:
-                node = self.node_genes[node_id]
-                if node_type is None or node.type == node_type:
-                    nodes.append(node)
-            else:
-                raise ValueError(f"Node ID {node_id} not found in genome.")
-        return nodes
+        return self.network.forward(inputs)
 
     def step(self, output_nodes, critter):
-        if output_nodes:
-            for output_node in output_nodes:
-                if output_node.name in self.neuron_manager.actuators:
-                    actuator_method = getattr(
-                        self.neuron_manager, f"act_{output_node.name}"
-                    )
-                    actuator_method(critter)
-                else:
-                    raise ValueError(f"Unknown actuator: {output_node.name}")
+        for output_node in output_nodes:
+            output_node.function(critter)
         self.fitness = critter.fitness
 
     def add_connection_gene(self, in_node, out_node, weight):
@@ -246,6 +199,31 @@ class Genome:
                 connection.weight,
             )
 
+    def get_genome_data(self):
+        """Returns the genome in the lab's design format, minus disabled links."""
+        genome_data = {
+            NeuronType.SENSOR: [],
+            NeuronType.ACTUATOR: [],
+            NeuronType.HIDDEN: [],
+            NeuronType.BIAS: [],
+            "connections": [],
+        }
+        for node_id, node in self.node_genes.items():
+            genome_data[node.type].append((node_id, node.name, node.type))
+
+        for conn in self.connection_genes.values():
+            if not conn.enabled:
+                continue
+            in_node, out_node = conn.in_node, conn.out_node
+            genome_data["connections"].append(
+                (
+                    (in_node._id, in_node.name, in_node.type, conn.weight),
+                    (out_node._id, out_node.name, out_node.type),
+                )
+            )
+
+        return genome_data
+
     def crossover(self, other_parent):
         """Clones one parent's genome directly for the child, reassigning new node IDs."""
         # We'll use self as the genome source
@@ -294,6 +272,203 @@ class Genome:
         return child_genome_data
 
 
+class CompiledNetwork:
+    """
+    Integer-indexed form of a Genome's topology, built once per genome.
+
+    Nodes are laid out in one value buffer as sensors, bias, hidden layers
+    (longest path from the inputs) and finally actuators ordered by their
+    connected group, so every layer is a contiguous slice computed with a
+    single dot product against the layers before it. Actuators are always
+    sinks, so they share the last layer.
+    """
+
+    signatures = {}
+
+    def __init__(self, genome):
+        hidden_layers = self._layer_hidden_nodes(genome)
+        actuator_groups = [
+            [node for node in genome.actuators if node._id in set(group)]
+            for group in genome.node_groups
+        ]
+        actuator_groups = [group for group in actuator_groups if group]
+
+        ordered_nodes = (
+            genome.sensors
+            + genome.bias
+            + [node for layer in hidden_layers for node in layer]
+            + [node for group in actuator_groups for node in group]
+        )
+        index = {node._id: i for i, node in enumerate(ordered_nodes)}
+
+        self.n_sensors = len(genome.sensors)
+        self.n_nodes = len(ordered_nodes)
+
+        # Connections into sensors or bias nodes never affect their values
+        edges = [
+            (index[conn.in_node._id], index[conn.out_node._id], conn.weight)
+            for conn in genome.connection_genes.values()
+            if conn.enabled
+            and conn.out_node.type in (NeuronType.HIDDEN, NeuronType.ACTUATOR)
+        ]
+        self.edge_sources = np.array([e[0] for e in edges], dtype=np.intp)
+        self.edge_targets = np.array([e[1] for e in edges], dtype=np.intp)
+        self.edge_weights = np.array([e[2] for e in edges], dtype=np.float64)
+
+        # Preallocated buffers; bias values never change
+        self.values = np.zeros(self.n_nodes, dtype=np.float64)
+        self.values[self.n_sensors : self.n_sensors + len(genome.bias)] = 1.0
+        self.sensor_values = self.values[: self.n_sensors]
+
+        # (start, end, weights) per layer, plus views of the buffer for each
+        self.n_bias = len(genome.bias)
+        self.layer_bounds = []
+        self.layers = []
+        start = self.n_sensors + self.n_bias
+        for layer in hidden_layers + [[node for g in actuator_groups for node in g]]:
+            end = start + len(layer)
+            if end > start:
+                weights = np.zeros((start, end - start), dtype=np.float64)
+                mask = (self.edge_targets >= start) & (self.edge_targets < end)
+                weights[self.edge_sources[mask], self.edge_targets[mask] - start] = (
+                    self.edge_weights[mask]
+                )
+                self.layer_bounds.append((start, end, weights))
+                self.layers.append(
+                    (self.values[:start], weights, self.values[start:end])
+                )
+            start = end
+
+        # Winner-takes-all bookkeeping over the actuator block
+        n_actuators = len(genome.actuators)
+        self.actuator_values = self.values[self.n_nodes - n_actuators :]
+        group_sizes = [len(group) for group in actuator_groups]
+        self.group_starts = np.cumsum([0] + group_sizes[:-1]).astype(np.intp)
+        self.group_index = np.repeat(np.arange(len(group_sizes)), group_sizes)
+        self.group_max = np.zeros(len(group_sizes), dtype=np.float64)
+        self.winner_max = np.zeros(n_actuators, dtype=np.float64)
+        self.fired = np.zeros(n_actuators, dtype=bool)
+        self.non_negative = np.zeros(n_actuators, dtype=bool)
+
+        # Results are reported in the genome's actuator order
+        block_position = {
+            node._id: i
+            for i, node in enumerate(node for g in actuator_groups for node in g)
+        }
+        self.actuators = genome.actuators
+        self.actuator_order = np.array(
+            [block_position[node._id] for node in genome.actuators], dtype=np.intp
+        )
+        self.fired_in_order = np.zeros(n_actuators, dtype=bool)
+
+        # Networks with equal signatures compute the same function, so they
+        # can be evaluated together by forward_batch(); signatures are interned
+        # to small ints so grouping does not rehash them every tick
+        signature = (
+            tuple(node.name for node in genome.sensors),
+            self.n_bias,
+            tuple(node.name for node in genome.actuators),
+            tuple(
+                (start, end, weights.tobytes())
+                for start, end, weights in self.layer_bounds
+            ),
+            self.group_starts.tobytes(),
+            self.actuator_order.tobytes(),
+        )
+        self.signature = self.signatures.setdefault(signature, len(self.signatures))
+
+    def _layer_hidden_nodes(self, genome):
+        """Groups hidden nodes by their longest path from the sensors and bias."""
+        depth = {}
+        hidden_ids = {node._id for node in genome.hidden}
+
+        def get_depth(node_id, path=()):
+            if node_id not in hidden_ids:
+                return 0
+            if node_id in path:
+                raise ValueError("Genome connections form a cycle.")
+            if node_id not in depth:
+                depth[node_id] = 1 + max(
+                    (
+                        get_depth(input_id, path + (node_id,))
+                        for input_id in genome.node_inputs.get(node_id, ())
+                    ),
+                    default=0,
+                )
+            return depth[node_id]
+
+        layers = defaultdict(list)
+        for node in genome.hidden:
+            layers[get_depth(node._id)].append(node)
+        return [layers[d] for d in sorted(layers)]
+
+    def forward(self, inputs):
+        """Runs the network and returns the actuator nodes that fire."""
+        self.sensor_values[:] = inputs
+        for layer_inputs, weights, layer_outputs in self.layers:
+            np.dot(layer_inputs, weights, out=layer_outputs)
+
+        if not self.actuators:
+            return []
+
+        # Uses a winner-takes-all activation function for the output layer
+        np.maximum.reduceat(self.actuator_values, self.group_starts, out=self.group_max)
+        np.take(self.group_max, self.group_index, out=self.winner_max)
+        np.equal(self.actuator_values, self.winner_max, out=self.fired)
+        np.greater_equal(self.winner_max, 0, out=self.non_negative)
+        self.fired &= self.non_negative
+
+        np.take(self.fired, self.actuator_order, out=self.fired_in_order)
+        return [self.actuators[i] for i in np.flatnonzero(self.fired_in_order)]
+
+    def forward_many(self, inputs):
+        """
+        Runs the network on a (N, sensors) array of inputs and returns a
+        (N, actuators) boolean array of fired actuators, in actuator order.
+        """
+        values = np.zeros((len(inputs), self.n_nodes), dtype=np.float64)
+        values[:, : self.n_sensors] = inputs
+        values[:, self.n_sensors : self.n_sensors + self.n_bias] = 1.0
+        for start, end, weights in self.layer_bounds:
+            np.matmul(values[:, :start], weights, out=values[:, start:end])
+
+        if not self.actuators:
+            return np.zeros((len(inputs), 0), dtype=bool)
+
+        actuator_values = values[:, self.n_nodes - len(self.actuators) :]
+        group_max = np.maximum.reduceat(actuator_values, self.group_starts, axis=1)
+        winner_max = group_max[:, self.group_index]
+        fired = (actuator_values == winner_max) & (winner_max >= 0)
+        return fired[:, self.actuator_order]
+
+
+def forward_batch(genomes, observations):
+    """
+    Evaluates many genomes at once, one matrix product per layer for each
+    group of genomes sharing a network signature (e.g. clones of the same
+    lab design). Returns the fired actuator nodes of each genome.
+    """
+    groups = defaultdict(list)
+    for i, genome in enumerate(genomes):
+        if len(observations[i]) != len(genome.sensors):
+            raise ValueError(
+                f"Expected {len(genome.sensors)} inputs, but got {len(observations[i])}."
+            )
+        groups[genome.network.signature].append(i)
+
+    outputs = [None] * len(genomes)
+    for rows in groups.values():
+        network = genomes[rows[0]].network
+        inputs = np.array(
+            [observations[i] for i in rows], dtype=np.float64
+        ).reshape(len(rows), network.n_sensors)
+
+        fired = network.forward_many(inputs).tolist()
+        for i, row in zip(rows, fired):
+            outputs[i] = list(compress(genomes[i].actuators, row))
+    return outputs
+
+
 class InnovationHistory:
     def __init__(self):
         self.innovation = 0
@@ -350,17 +525,66 @@ class NeuronManager:
     }
     # fmt: on
 
-    def __init__(self, critters=None, plants=None):
+    # Grid cell size used until the first critter defines a vision range
+    DEFAULT_CELL_SIZE = 100
+
+    def __init__(self, critters=None, forest=None, scanner=None):
         self.critters = critters or []
-        self.plants = plants or []
+        # Owns the plants and their spatial index
+        self.forest = forest
+        # Optional PartitionedSensing, see prefetch
+        self.scanner = scanner
+        self.mouse_position = None
         self.context = {}
-
-    def update(self, critters, plants):
+        self.critter_grid = SpatialGrid(self.DEFAULT_CELL_SIZE)
+        # What actuators did to others this tick, settled by commit()
+        self.attacks = []
+        self.meals = []
+        self.signals = []
+        self.matings = []
+
+    def update(self, critters, mouse_position=None):
+        """
+        Refreshes the world snapshot; mouse_position is the world point under
+        the pointer, None when headless or off the env.
+        """
         self.critters = critters
-        self.plants = plants
+        self.mouse_position = mouse_position
+
+        # Cells as wide as the largest vision rect keep queries to ~3x3 cells
+        cell_size = max(
+            (critter.rect.width for critter in critters),
+            default=self.DEFAULT_CELL_SIZE,
+        )
+        self.critter_grid.rebuild(critters, cell_size)
+
+    def track_critter(self, critter):
+        """Keeps the critter grid in sync after a critter moved or was born."""
+        self.critter_grid.move(critter)
+
+    def forget_critter(self, critter):
+        self.critter_grid.remove(critter)
+        self.context.pop(critter.id, None)
 
-        self.critters_rect = [critter.rect for critter in self.critters]
-        self.plants_rect = [plant.rect for plant in self.plants]
+    def prefetch(self, critters):
+        """
+        Runs every critter's vision scan for the tick up front on the
+        scanner's workers, when there is one and enough critters to pay for
+        it; the sensors then read the results from the context.
+        """
+        if self.scanner is None or len(critters) < PARALLEL_MIN_CRITTERS:
+            return
+
+        for critter, neighbourhood, food in self.scanner.scan(critters, self.forest):
+            self._update_context(
+                id=critter.id,
+                key="neighbourhood",
+                time=critter.time,
+                data=neighbourhood,
+            )
+            self._update_context(
+                id=critter.id, key="food", time=critter.time, data=food
+            )
 
     # --- SENSOR FUNCTIONS ---
 
@@ -369,49 +593,47 @@ class NeuronManager:
 
     def obs_FDi(self, critter):
         """Returns normalized distance to the nearest food source, scaled to range -1 to 1."""
-        return self._get_normalized_nearest_distance(
-            critter=critter,
-            objects=self.plants,
-            context_key="closest_food",
+        food = self._lookup_context(id=critter.id, time=critter.time, key="food")
+        if food is not None:
+            nearest = food[0]
+        else:
+            nearest = self.forest.get_nearest_plant(critter.rect)
+        if nearest is None:
+            return 1.0
+
+        food, distance = nearest
+        self._update_context(
+            id=critter.id,
+            key="closest_food",
+            time=critter.time,
+            data=food,
         )
+        return self._normalize_distance(critter, distance)
 
     def obs_SDi(self, critter):
         """Returns normalized distance to the nearest critter of the same species."""
-        return self._get_normalized_nearest_distance(
-            critter=critter,
-            objects=self.critters,
-            context_key="closest_same_critter",
-            filter_fn=(
-                lambda other: other.species == critter.species
-                and other.id != critter.id
-            ),
+        return self._get_normalized_neighbour_distance(
+            critter=critter, context_key="closest_same_critter"
         )
 
     def obs_ODi(self, critter):
         """Returns normalized distance to the nearest critter of a different species."""
-        return self._get_normalized_nearest_distance(
-            critter=critter,
-            objects=self.critters,
-            context_key="closest_other_critter",
-            filter_fn=(
-                lambda other: other.species != critter.species
-                and other.id != critter.id
-            ),
+        return self._get_normalized_neighbour_distance(
+            critter=critter, context_key="closest_other_critter"
         )
 
     def obs_ADi(self, critter):
         """Returns normalized distance to the nearest critter of any species."""
-        return self._get_normalized_nearest_distance(
-            critter=critter,
-            objects=self.critters,
-            context_key="closest_any_critter",
-            filter_fn=lambda other: other.id != critter.id,
+        return self._get_normalized_neighbour_distance(
+            critter=critter, context_key="closest_any_critter"
         )
 
     def obs_MsD(self, critter):
         """Proximity to mouse pointer, if in visibility."""
-        x, y = pygame.mouse.get_pos()
-        mouse_pos = (x - ENV_OFFSET_X, y - ENV_OFFSET_Y)
+        if self.mouse_position is None:
+            return 1.0
+
+        mouse_pos = self.mouse_position
         if not critter.rect.collidepoint(mouse_pos):
             return 1.0
 
@@ -431,36 +653,38 @@ class NeuronManager:
 
     def obs_FAm(self, critter):
         """Returns normalized density of food sources in the critter's vision range."""
-        return self._get_normalized_density(
-            critter=critter,
-            objects=self.plants,
-            context_key="food_density",
+        food = self._lookup_context(id=critter.id, time=critter.time, key="food")
+        if food is not None:
+            count = food[1]
+        else:
+            count = self.forest.count_plants_in(critter.rect)
+        if not count:
+            return -1.0
+
+        self._update_context(
+            id=critter.id,
+            key="food_density",
+            time=critter.time,
+            data=count,
         )
+        return self._normalize_density(count)
 
     def obs_AAm(self, critter):
         """Returns normalized density of same-species critters in the critter's vision range."""
-        return self._get_normalized_density(
-            critter=critter,
-            objects=self.critters,
-            context_key="same_critter_density",
-            filter_fn=lambda other: other.species == critter.species,
+        return self._get_normalized_neighbour_density(
+            critter=critter, context_key="same_critter_density"
         )
 
     def obs_OAm(self, critter):
         """Returns normalized density of other-species critters in the critter's vision range."""
-        return self._get_normalized_density(
-            critter=critter,
-            objects=self.critters,
-            context_key="other_critter_density",
-            filter_fn=lambda other: other.species != critter.species,
+        return self._get_normalized_neighbour_density(
+            critter=critter, context_key="other_critter_density"
         )
 
     def obs_CAm(self, critter):
         """Returns normalized density of any-species critters in the critter's vision range."""
-        return self._get_normalized_density(
-            critter=critter,
-            objects=self.critters,
-            context_key="any_critter_density",
+        return self._get_normalized_neighbour_density(
+            critter=critter, context_key="any_critter_density"
         )
 
     def obs_CEn(self, critter):
@@ -473,8 +697,7 @@ class NeuronManager:
 
     def obs_CFi(self, critter):
         """Current fitness of the critter, compared to average."""
-        fitness_sum = sum(c.fitness for c in self.critters)
-        average_fitness = fitness_sum / len(self.critters)
+        average_fitness = critter.stats.get_mean_fitness()
         if average_fitness == 0:
             return 1.0
         else:
@@ -520,24 +743,18 @@ class NeuronManager:
         critter.rect.y += math.sin(critter.angle)
 
     def act_Eat(self, critter):
-        """Eats the nearest food source if in range."""
+        """Eats the nearest food source if in range, pulls it closer otherwise."""
         if food := self._lookup_context(
             id=critter.id, time=critter.time, key="closest_food"
         ):
-            if critter.body_rect.colliderect(food.rect):
-                self.plants.remove(food)
-                critter.energy += 500
-                critter.fitness += 1
-            else:
-                new_x, new_y = self._get_movement_step(critter, food, pull=True)
-                food.rect.x, food.rect.y = new_x, new_y
+            self.meals.append((critter, food))
 
     def act_MvS(self, critter):
         """Moves towards the nearest same-species critter, if found."""
         if other := self._lookup_context(
             id=critter.id, time=critter.time, key="closest_same_critter"
         ):
-            if other.rect.center != critter.rect.center:
+            if other.body_rect.center != critter.rect.center:
                 new_x, new_y = self._get_movement_step(critter, other)
                 critter.rect.x, critter.rect.y = new_x, new_y
 
@@ -546,7 +763,7 @@ class NeuronManager:
         if other := self._lookup_context(
             id=critter.id, time=critter.time, key="closest_other_critter"
         ):
-            if other.rect.center != critter.rect.center:
+            if other.body_rect.center != critter.rect.center:
                 new_x, new_y = self._get_movement_step(critter, other)
                 critter.rect.x, critter.rect.y = new_x, new_y
 
@@ -555,7 +772,7 @@ class NeuronManager:
         if other := self._lookup_context(
             id=critter.id, time=critter.time, key="closest_any_critter"
         ):
-            if other.rect.center != critter.rect.center:
+            if other.body_rect.center != critter.rect.center:
                 new_x, new_y = self._get_movement_step(critter, other)
                 critter.rect.x, critter.rect.y = new_x, new_y
 
@@ -581,25 +798,7 @@ class NeuronManager:
         """Activates defense mechanism when triggered, deactivates otherwise."""
         critter.defense_active = True
         if critter.defense_mechanism == Defence.SWORDLING:
-            collision_indices = critter.interaction_rect.collidelistall(
-                [other.interaction_rect for other in self.critters]
-            )
-            if collision_indices:
-                for i in collision_indices:
-                    other = self.critters[i]
-                    if other.id == critter.id:
-                        continue
-                    elif other.defense_active and (
-                        other.defense_mechanism
-                        in [
-                            Defence.SHIELDLING,
-                            Defence.CAMOUFLING,
-                        ]
-                    ):
-                        continue
-                    else:
-                        other.energy = 0
-                        critter.fitness += 1
+            self.attacks.append(critter)
 
     def act_DDe(self, critter):
         """Deactivates defense mechanism when triggered."""
@@ -610,7 +809,7 @@ class NeuronManager:
         if other := self._lookup_context(
             id=critter.id, time=critter.time, key="closest_same_critter"
         ):
-            if other.rect.center != critter.rect.center:
+            if other.body_rect.center != critter.rect.center:
                 new_x, new_y = self._get_avoidance_step(critter, other)
                 critter.rect.x, critter.rect.y = new_x, new_y
 
@@ -619,7 +818,7 @@ class NeuronManager:
         if other := self._lookup_context(
             id=critter.id, time=critter.time, key="closest_other_critter"
         ):
-            if other.rect.center != critter.rect.center:
+            if other.body_rect.center != critter.rect.center:
                 new_x, new_y = self._get_avoidance_step(critter, other)
                 critter.rect.x, critter.rect.y = new_x, new_y
 
@@ -628,7 +827,7 @@ class NeuronManager:
         if other := self._lookup_context(
             id=critter.id, time=critter.time, key="closest_any_critter"
         ):
-            if other.rect.center != critter.rect.center:
+            if other.body_rect.center != critter.rect.center:
                 new_x, new_y = self._get_avoidance_step(critter, other)
                 critter.rect.x, critter.rect.y = new_x, new_y
 
@@ -659,89 +858,212 @@ class NeuronManager:
                 other.mating_state == MatingState.READY
                 and critter.mating_state == MatingState.READY
             ):
-                other.incoming_mate_request = critter
+                self.signals.append((critter, other))
 
     def act_Mte(self, critter):
         """Mate; if mate found"""
         if critter.mating_state == MatingState.MATING:
+            self.matings.append(critter)
+
+    # --- COMMIT ---
+
+    def commit(self):
+        """
+        Settles what critters did to each other this tick, once all of them
+        acted and their moves were committed, so the outcome doesn't depend
+        on who acted first. Fights go first and the fallen neither eat nor
+        mate; a plant or a critter wanted by several goes to the nearest.
+        """
+        killed = self._commit_attacks()
+        self._commit_meals(killed)
+        self._commit_signals()
+        self._commit_matings(killed)
+        self.attacks, self.meals, self.signals, self.matings = [], [], [], []
+
+    def _commit_attacks(self):
+        killed = set()
+        for critter in self.attacks:
+            # Interaction rects sit inside the vision rects, so the grid's
+            # vision-range neighbours are a superset of the ones in reach
+            for other in self.critter_grid.query(critter.rect):
+                if other.id == critter.id or not critter.interaction_rect.colliderect(
+                    other.interaction_rect
+                ):
+                    continue
+                elif other.defense_active and (
+                    other.defense_mechanism
+                    in [
+                        Defence.SHIELDLING,
+                        Defence.CAMOUFLING,
+                    ]
+                ):
+                    continue
+                else:
+                    # Nothing checked above changes here, so two swordlings
+                    # in reach of each other both fall
+                    other.energy = 0
+                    critter.fitness += 1
+                    killed.add(other)
+        return killed
+
+    def _commit_meals(self, killed):
+        eaters, pullers = defaultdict(list), defaultdict(list)
+        for critter, food in self.meals:
+            if critter in killed or not self.forest.has_plant(food):
+                continue
+            if critter.body_rect.colliderect(food.rect):
+                eaters[food].append(critter)
+            else:
+                pullers[food].append(critter)
+
+        for food, critters in eaters.items():
+            critter = self._get_nearest(food, critters)
+            self.forest.remove_plant(food)
+            critter.energy += 500
+            critter.fitness += 1
+
+        for food, critters in pullers.items():
+            if food in eaters:
+                continue
+            critter = self._get_nearest(food, critters)
+            new_x, new_y = self._get_movement_step(critter, food, pull=True)
+            food.rect.x, food.rect.y = new_x, new_y
+            self.forest.move_plant(food)
+
+    def _commit_signals(self):
+        senders = defaultdict(list)
+        for critter, other in self.signals:
+            senders[other].append(critter)
+        for other, critters in senders.items():
+            other.incoming_mate_request = self._get_nearest(other, critters)
+
+    def _commit_matings(self, killed):
+        # Both partners may have asked; the one in the lower row carries
+        for critter in sorted(self.matings, key=lambda critter: critter._index):
+            if critter.mating_state != MatingState.MATING:
+                continue
+            mate = critter.mate
+            if (
+                critter in killed
+                or mate in killed
+                or not (critter.alive and mate.alive)
+            ):
+                # No child from a fallen pair; a survivor is free to look again
+                mate.remove_mate()
+                critter.remove_mate()
+                continue
             critter.crossover()
             critter.mate.remove_mate()
             critter.remove_mate()
             critter.fitness += 1
 
     # --- HELPER FUNCTIONS ---
-    def _get_normalized_nearest_distance(
-        self, critter, objects, context_key, filter_fn=None
-    ):
-        """Returns normalized distance to the nearest object in 'objects', scaled to [-1, 1].
-        Optionally filters objects using 'filter_fn'.
+    def _get_neighbourhood(self, critter):
+        """Scans the critters in vision once per tick; every critter sensor reads it.
+
+        Nearest entries exclude the critter itself, densities include it.
         """
-        colliding_indices = critter.rect.collidelistall([obj.rect for obj in objects])
+        neighbourhood = self._lookup_context(
+            id=critter.id, time=critter.time, key="neighbourhood"
+        )
+        if neighbourhood is not None:
+            return neighbourhood
 
-        if not colliding_indices or (
-            len(colliding_indices) == 1
-            and getattr(objects[colliding_indices[0]], "id", None) == critter.id
-        ):
-            return 1.0
+        nearest = {
+            "closest_same_critter": (math.inf, None),
+            "closest_other_critter": (math.inf, None),
+            "closest_any_critter": (math.inf, None),
+        }
+        same_count = other_count = 0
 
-        filtered_objects = [
-            objects[i]
-            for i in colliding_indices
-            if not filter_fn or filter_fn(objects[i])
-        ]
+        for other in self.critter_grid.query(critter.rect):
+            if other.species == critter.species:
+                same_count += 1
+                nearest_key = "closest_same_critter"
+            else:
+                other_count += 1
+                nearest_key = "closest_other_critter"
 
-        if not filtered_objects:
-            return 1.0
+            if other.id == critter.id:
+                continue
 
-        closest_obj = min(
-            filtered_objects,
-            key=lambda obj: helper.distance_between_points(
-                critter.rect.center, obj.rect.center
-            ),
+            distance = helper.distance_between_points(
+                critter.rect.center, other.rect.center
+            )
+            if distance < nearest[nearest_key][0]:
+                nearest[nearest_key] = (distance, other)
+            if distance < nearest["closest_any_critter"][0]:
+                nearest["closest_any_critter"] = (distance, other)
+
+        neighbourhood = {
+            **nearest,
+            "same_critter_density": same_count,
+            "other_critter_density": other_count,
+            "any_critter_density": same_count + other_count,
+        }
+        self._update_context(
+            id=critter.id,
+            key="neighbourhood",
+            time=critter.time,
+            data=neighbourhood,
         )
+        return neighbourhood
+
+    def _get_normalized_neighbour_distance(self, critter, context_key):
+        """Normalized distance to the nearest neighbour stored under 'context_key'."""
+        distance, closest = self._get_neighbourhood(critter)[context_key]
+        if closest is None:
+            return 1.0
 
         self._update_context(
             id=critter.id,
             key=context_key,
             time=critter.time,
-            data=closest_obj,
-        )
-
-        min_distance = helper.distance_between_points(
-            critter.rect.center, closest_obj.rect.center
+            data=closest,
         )
+        return self._normalize_distance(critter, distance)
 
-        # Normalize to [-1, 1]
-        return (min(min_distance / (critter.rect.width // 2), 1) * 2) - 1
-
-    def _get_normalized_density(self, critter, objects, context_key, filter_fn=None):
-        """Returns normalized density of objects in 'objects' within critter's vision range."""
-        colliding_indices = critter.rect.collidelistall([obj.rect for obj in objects])
-
-        if not colliding_indices:
-            return -1.0
-
-        filtered_objects = [
-            objects[i]
-            for i in colliding_indices
-            if not filter_fn or filter_fn(objects[i])
-        ]
-
-        if not filtered_objects:
+    def _get_normalized_neighbour_density(self, critter, context_key):
+        """Normalized count of neighbours stored under 'context_key'."""
+        count = self._get_neighbourhood(critter)[context_key]
+        if not count:
             return -1.0
 
         self._update_context(
             id=critter.id,
             key=context_key,
             time=critter.time,
-            data=len(filtered_objects),
+            data=count,
+        )
+        return self._normalize_density(count)
+
+    def _get_nearest(self, target, critters):
+        """The critter closest to target, the one in the lower row on a tie."""
+        return min(
+            critters,
+            key=lambda critter: (
+                helper.distance_between_points(critter.rect.center, target.rect.center),
+                critter._index,
+            ),
         )
 
+    def _get_target_rect(self, target):
+        # Critters only move their rect until the commit, their body rect
+        # stays where the tick started
+        if isinstance(target, pygame.Rect):
+            return target
+        return getattr(target, "body_rect", target.rect)
+
+    def _normalize_distance(self, critter, distance):
+        # Normalize to [-1, 1]
+        return (min(distance / (critter.rect.width // 2), 1) * 2) - 1
+
+    def _normalize_density(self, count):
         # Normalize to [-1, 1]
-        return (min(len(filtered_objects) / 10, 1) * 2) - 1
+        return (min(count / 10, 1) * 2) - 1
 
     def _get_movement_step(self, mover, target, step_size=1, pull=False):
-        target_rect = target if isinstance(target, pygame.Rect) else target.rect
+        target_rect = self._get_target_rect(target)
         dx = target_rect.centerx - mover.rect.centerx
         dy = target_rect.centery - mover.rect.centery
 
@@ -769,7 +1091,7 @@ class NeuronManager:
         return new_x, new_y
 
     def _get_avoidance_step(self, mover, target, step_size=1):
-        target_rect = target if isinstance(target, pygame.Rect) else target.rect
+        target_rect = self._get_target_rect(target)
         dx = mover.rect.centerx - target_rect.centerx
         dy = mover.rect.centery - target_rect.centery
 
@@ -0,0 +1,138 @@
+import numpy as np
+
+
+class SeriesHistory:
+    """
+    Fixed-memory time series of named values, e.g. population per species.
+
+    Samples are kept at several resolutions: level 0 holds the most recent
+    raw samples, and each level above summarizes ``factor`` times as many
+    samples per bucket as the one below, as the min, max and mean of the
+    samples that fell in it. Every level is a ring of ``capacity`` buckets,
+    so memory stays bounded however long the run is, and an append only
+    updates one bucket per level.
+
+    Values are stored column-wise, one column per series name. A series
+    that shows up late reads as 0 before its first sample, and one missing
+    from a sample reads as 0 in it.
+    """
+
+    def __init__(self, capacity=512, factor=4, levels=8):
+        self.capacity = capacity
+        self.factor = factor
+        self.names = []
+        self.columns = {}  # name -> column index
+        self.samples = 0
+        self.levels = [_Level(capacity, factor**level) for level in range(levels)]
+
+    def __len__(self):
+        return self.samples
+
+    def append(self, time, values):
+        for name in values:
+            if name not in self.columns:
+                self._add_series(name)
+
+        row = np.zeros(len(self.names))
+        for name, value in values.items():
+            row[self.columns[name]] = value
+
+        self.samples += 1
+        for level in self.levels:
+            level.add(time, row)
+
+    def get_window(self, max_points=None):
+        """
+        Returns (times, lows, means, highs) at the finest resolution that
+        still covers every sample in at most ``max_points`` points, or the
+        coarsest one if none does. The value arrays are (points, series),
+        with columns in the order of ``names``.
+        """
+        limit = self.capacity if max_points is None else min(max_points, self.capacity)
+        for level in self.levels:
+            if level.points(self.samples) <= limit:
+                break
+        return level.window()
+
+    def _add_series(self, name):
+        self.columns[name] = len(self.names)
+        self.names.append(name)
+        for level in self.levels:
+            level.add_column()
+
+
+class _Level:
+    """One resolution of a SeriesHistory: a ring of buckets plus the open one."""
+
+    def __init__(self, capacity, span):
+        self.capacity = capacity
+        self.span = span  # raw samples per bucket
+        self.start = 0  # ring index of the oldest bucket
+        self.size = 0
+
+        self.times = np.zeros(capacity)
+        self.lows = np.zeros((capacity, 0))
+        self.means = np.zeros((capacity, 0))
+        self.highs = np.zeros((capacity, 0))
+
+        # The bucket being filled
+        self.count = 0
+        self.time_sum = 0.0
+        self.low = np.zeros(0)
+        self.high = np.zeros(0)
+        self.sum = np.zeros(0)
+
+    def points(self, samples):
+        """Buckets needed to show `samples` samples, open bucket included."""
+        return -(-samples // self.span)
+
+    def add_column(self):
+        self.lows = np.pad(self.lows, ((0, 0), (0, 1)))
+        self.means = np.pad(self.means, ((0, 0), (0, 1)))
+        self.highs = np.pad(self.highs, ((0, 0), (0, 1)))
+        # Before its first sample the series was 0, open bucket included
+        self.low = np.append(self.low, 0.0 if self.count else np.inf)
+        self.high = np.append(self.high, 0.0 if self.count else -np.inf)
+        self.sum = np.append(self.sum, 0.0)
+
+    def add(self, time, row):
+        if self.count == 0:
+            self.low[:] = row
+            self.high[:] = row
+            self.sum[:] = row
+            self.time_sum = time
+        else:
+            np.minimum(self.low, row, out=self.low)
+            np.maximum(self.high, row, out=self.high)
+            self.sum += row
+            self.time_sum += time
+        self.count += 1
+
+        if self.count == self.span:
+            self._close()
+
+    def _close(self):
+        if self.size < self.capacity:
+            index = (self.start + self.size) % self.capacity
+            self.size += 1
+        else:
+            # Full, overwrite the oldest bucket
+            index = self.start
+            self.start = (self.start + 1) % self.capacity
+
+        self.times[index] = self.time_sum / self.count
+        self.lows[index] = self.low
+        self.means[index] = self.sum / self.count
+        self.highs[index] = self.high
+        self.count = 0
+
+    def window(self):
+        order = (self.start + np.arange(self.size)) % self.capacity
+        times = self.times[order]
+        lows, means, highs = self.lows[order], self.means[order], self.highs[order]
+        if self.count:
+            times = np.append(times, self.time_sum / self.count)
+            lows = np.vstack((lows, self.low))
+            means = np.vstack((means, self.sum / self.count))
+            highs = np.vstack((highs, self.high))
+        return times, lows, means, highs
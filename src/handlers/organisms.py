@@ -9,33 +9,49 @@ import pygame
 
 from src import helper
 import src.agents as agents
+from src.handlers import genetics
+from src.handlers.spatial import SpatialGrid
 from src.config import Colors, Fonts
 from src.enums import Attributes, MatingState, SurfDesc
 
 
 class Forest:
+    # Plants are 8px wide, so a vision rect spans a handful of cells
+    CELL_SIZE = 64
+
     def __init__(self, context=None) -> None:
-        self.env_surface = context["env_surface"]
+        self.world = context["world"]
         self.origins = np.array(
             [
                 (
-                    random.randrange(0, self.env_surface.get_width()),
-                    random.randrange(0, self.env_surface.get_height()),
+                    random.randrange(0, self.world.get_width()),
+                    random.randrange(0, self.world.get_height()),
                 )
                 for _ in range(5)
             ]
         )
         self.radii = np.array([random.randint(50, 100) for _ in range(5)])
-        self.plants = []
+        # Plants only move when pulled by a critter, so the index is kept in
+        # place instead of being rebuilt; iterating it yields every plant
+        self.plants = SpatialGrid(self.CELL_SIZE)
+        # Plants added, removed or moved since pop_plant_changes last ran,
+        # None until a renderer first asks so headless runs track nothing
+        self.changed_plants = None
+        # Plant centers and colors as array rows, kept in step with the grid;
+        # rows are removed by swapping the last row into the hole
+        self.plant_rows = {}  # plant -> row
+        self.plant_order = []  # row -> plant
+        self.plant_centers = np.zeros((64, 2), dtype=np.int64)
+        self.plant_colors = np.zeros((64, 3), dtype=np.uint8)
 
     def bulk_generate_plants_patch(self, n):
         cluster_points = self.get_random_coords(n)
         for _ in range(n):
             # Use single-layer Perlin noise for simplicity
             for x, y in cluster_points:
-                self.plants.append(
+                self.add_plant(
                     agents.Plant(
-                        self.env_surface,
+                        self.world,
                         pos=(x, y),
                     )
                 )
@@ -59,7 +75,7 @@ class Forest:
         self.radii += 10
         cluster_points = self.get_random_coords(10)
         for x, y in cluster_points:
-            self.plants.append(agents.Plant(self.env_surface, pos=(x, y)))
+            self.add_plant(agents.Plant(self.world, pos=(x, y)))
 
     def get_plants(self):
         return self.plants
@@ -67,50 +83,307 @@ class Forest:
     def get_plant_count(self):
         return len(self.plants)
 
+    def has_plant(self, plant):
+        return plant in self.plants
+
+    def add_plant(self, plant):
+        self.plants.insert(plant)
+        row = len(self.plant_order)
+        if row == len(self.plant_centers):
+            self.plant_centers = np.concatenate((self.plant_centers,) * 2)
+            self.plant_colors = np.concatenate((self.plant_colors,) * 2)
+        self.plant_rows[plant] = row
+        self.plant_order.append(plant)
+        self.plant_centers[row] = plant.rect.center
+        self.plant_colors[row] = plant.color[:3]
+        self._note_change(plant)
+
     def remove_plant(self, plant):
         self.plants.remove(plant)
+        row = self.plant_rows.pop(plant, None)
+        if row is not None:
+            last = self.plant_order.pop()
+            if last is not plant:
+                self.plant_order[row] = last
+                self.plant_rows[last] = row
+                self.plant_centers[row] = self.plant_centers[len(self.plant_order)]
+                self.plant_colors[row] = self.plant_colors[len(self.plant_order)]
+        self._note_change(plant)
+
+    def move_plant(self, plant):
+        """Re-indexes a plant after its rect was moved."""
+        self.plants.move(plant)
+        self.plant_centers[self.plant_rows[plant]] = plant.rect.center
+        self._note_change(plant)
+
+    def pop_plant_changes(self):
+        """
+        Returns the plants added, removed or moved since the last call. The
+        first call starts the tracking and returns None, meaning everything.
+        """
+        changed = self.changed_plants
+        self.changed_plants = set()
+        return changed
+
+    def get_plant_arrays(self):
+        """Returns (centers, colors) of every plant as (n, 2) and (n, 3) arrays."""
+        n = len(self.plant_order)
+        return self.plant_centers[:n], self.plant_colors[:n]
+
+    def _note_change(self, plant):
+        if self.changed_plants is not None:
+            self.changed_plants.add(plant)
+
+    def get_plants_in(self, rect):
+        return self.plants.query(rect)
+
+    def count_plants_in(self, rect):
+        return self.plants.count(rect)
+
+    def get_nearest_plant(self, rect):
+        """Returns (plant, distance) for the plant in rect nearest its center, or None."""
+        return self.plants.nearest(rect)
+
+
+class CritterState:
+    """
+    Structure-of-arrays store for the living critters of a Species.
+
+    Row i belongs to ``critters[i]``; the critter's lifecycle attributes are
+    views into these columns (see ``agents.StateField``). Rows are removed by
+    swapping the last row into the hole, so ``critters`` is never rebuilt
+    and adding, removing or finding a critter by id is O(1).
+    """
+
+    def __init__(self, world, capacity=64):
+        self.world = world
+        self.count = 0
+        self.critters = []
+        self.by_id = {}
+        self.arrays = {
+            "position": np.zeros((capacity, 2), dtype=np.int64),
+            "velocity": np.zeros((capacity, 2), dtype=np.int64),
+            "max_speed": np.zeros(capacity, dtype=np.int64),
+            "max_energy": np.zeros(capacity, dtype=np.int64),
+            "color": np.zeros((capacity, 3), dtype=np.uint8),
+            **{
+                name: np.zeros(capacity, dtype=np.int64)
+                for name in agents.Critter.STATE_FIELDS
+            },
+        }
+
+    def __len__(self):
+        return self.count
+
+    def add(self, critter):
+        if self.count == len(self.arrays["position"]):
+            self._grow()
+
+        i = self.count
+        for name in agents.Critter.STATE_FIELDS:
+            self.arrays[name][i] = getattr(critter, name)
+        self.arrays["position"][i] = critter.rect.center
+        self.arrays["velocity"][i] = 0
+        self.arrays["max_speed"][i] = critter.max_speed
+        self.arrays["max_energy"][i] = critter.max_energy
+        self.arrays["color"][i] = critter.color[:3]
+
+        # Shares the dict, so the critter keeps seeing columns after a _grow
+        critter._arrays = self.arrays
+        critter._index = i
+        self.critters.append(critter)
+        self.by_id[critter.id] = critter
+        self.count += 1
+
+    def remove(self, critter):
+        i = critter._index
+        last = self.count - 1
+
+        # Hand the critter a detached copy of its final state
+        critter._arrays = {
+            name: self.arrays[name][i : i + 1].copy()
+            for name in agents.Critter.STATE_FIELDS
+        }
+        critter._index = 0
+
+        if i != last:
+            for column in self.arrays.values():
+                column[i] = column[last]
+            moved = self.critters[last]
+            moved._index = i
+            self.critters[i] = moved
+
+        self.critters.pop()
+        del self.by_id[critter.id]
+        self.count -= 1
+
+    def advance(self):
+        """Ages the population one tick and returns the critters that expired."""
+        n = self.count
+        a = self.arrays
+        a["time"][:n] += 1
+        a["age"][:n] += 1
+        a["energy"][:n] -= 1
+        a["current_mating_timeout"][:n] -= 1
+
+        expired = np.flatnonzero(
+            (a["energy"][:n] <= 0) | (a["age"][:n] >= a["max_lifespan"][:n])
+        )
+        return [self.critters[i] for i in expired]
+
+    def commit_moves(self):
+        """
+        Applies this tick's moves: each critter's displacement since the last
+        commit is clamped to its max speed and wrapped around the world.
+        """
+        n = self.count
+        if not n:
+            return
+
+        a = self.arrays
+        position = a["position"][:n]
+        max_speed = a["max_speed"][:n, np.newaxis]
+
+        target = np.array([critter.rect.center for critter in self.critters])
+        velocity = np.clip(target - position, -max_speed, max_speed)
+        position += velocity
+        position %= self.world.get_size()
+        a["velocity"][:n] = velocity
+
+        for critter, center in zip(self.critters, position.tolist()):
+            critter.set_center(center)
+
+    def cap_energy(self):
+        n = self.count
+        a = self.arrays
+        np.minimum(a["energy"][:n], a["max_energy"][:n], out=a["energy"][:n])
+
+    def _grow(self):
+        for name, column in self.arrays.items():
+            grown = np.zeros((len(column) * 2, *column.shape[1:]), dtype=column.dtype)
+            grown[: self.count] = column[: self.count]
+            self.arrays[name] = grown
+
+
+class PopulationStats:
+    """
+    Running per-species and overall ("total") critter counts and fitness
+    sums. Species reports births and deaths, critters report fitness
+    changes through their ``fitness`` setter, so reads never scan.
+    """
+
+    def __init__(self):
+        self.count = {"total": 0}
+        self.fitness = {"total": 0}
+        self.colors = {}
+
+    def add(self, critter):
+        species = critter.species
+        self.count["total"] += 1
+        self.count[species] = self.count.get(species, 0) + 1
+        self.fitness["total"] += critter.fitness
+        self.fitness[species] = self.fitness.get(species, 0) + critter.fitness
+        self.colors[species] = critter.color
+        critter.stats = self
+
+    def remove(self, critter):
+        species = critter.species
+        critter.stats = None
+        self.count["total"] -= 1
+        self.fitness["total"] -= critter.fitness
+        self.count[species] -= 1
+        self.fitness[species] -= critter.fitness
+
+        # Extinct species drop out, as they would from a fresh count
+        if not self.count[species]:
+            del self.count[species]
+            del self.fitness[species]
+            del self.colors[species]
+
+    def add_fitness(self, species, delta):
+        self.fitness["total"] += delta
+        self.fitness[species] += delta
+
+    def get_count(self, species="total"):
+        return self.count.get(species, 0)
+
+    def get_mean_fitness(self, species="total"):
+        count = self.count.get(species, 0)
+        if not count:
+            return 0
+        return self.fitness[species] / count
 
 
 class Species:
     def __init__(self, context=None) -> None:
         self.neuron_manager = context["neuron_manager"]
         self.critter_population = 0
-        self.surface = context["env_surface"]
-        self.critters = []
+        self.world = context["world"]
+        self.state = CritterState(self.world)
+        # Shared with the state, whose swap-removes keep it in step
+        self.critters = self.state.critters
+        self.stats = PopulationStats()
         self.dead_critters = []
 
     def create_species(self, n, context):
         context["genome"]["neuron_manager"] = self.neuron_manager
         for _ in range(n):
-            self.critters.append(
-                agents.Critter(
-                    surface=self.surface,
-                    context=context.copy(),
-                )
+            self.add_critter(
+                agents.Critter(world=self.world, context=context.copy())
             )
 
         return self.critters
 
+    def add_critter(self, critter):
+        self.state.add(critter)
+        self.stats.add(critter)
+        self.neuron_manager.track_critter(critter)
+
+    def remove_critter(self, critter):
+        self.state.remove(critter)
+        self.stats.remove(critter)
+        self.neuron_manager.forget_critter(critter)
+
     def evaluate_critters(self):
         for critter in self.critters:
             critter.evaluate()
 
     def step(self, events):
         response = None
-        for critter in self.critters.copy():
-            response = critter.step(events) or response
-            if not critter.alive:
-                self.critters.remove(critter)
-                self.dead_critters.append(critter)
-
-            if critter.FETUS:
-                self.critters.append(
-                    agents.Critter(
-                        surface=self.surface,
-                        context=critter.FETUS.copy(),
-                    )
-                )
-                critter.FETUS = None
+        for critter in self.state.advance():
+            critter.die()
+            self.dead_critters.append(critter)
+            self.remove_critter(critter)
+
+        # Mating handshakes settle in row order, before anyone looks
+        for critter in self.critters:
+            critter.update_mating_state()
+
+        # Everyone senses the same world before anyone acts, so brains can
+        # run in one batch
+        self.neuron_manager.prefetch(self.critters)
+        observations = [critter.sense() for critter in self.critters]
+        outputs = genetics.forward_batch(
+            [critter.genome for critter in self.critters], observations
+        )
+
+        # Acting only moves the critter itself; what it does to others is
+        # collected and settled once every move is committed
+        for critter, output in zip(self.critters, outputs):
+            response = critter.act(output) or response
+
+        self.state.commit_moves()
+        for critter in self.critters:
+            self.neuron_manager.track_critter(critter)
+        self.neuron_manager.commit()
+        self.state.cap_energy()
+
+        for parent in [critter for critter in self.critters if critter.FETUS]:
+            self.add_critter(
+                agents.Critter(world=self.world, context=parent.FETUS.copy())
+            )
+            parent.FETUS = None
+
         return response
 
     def get_critters(self, alive=True):
@@ -120,7 +393,7 @@ class Species:
             return self.dead_critters
 
     def get_critter_info(self, critter_id, all=True):
-        critter = next((c for c in self.critters if c.id == critter_id), None)
+        critter = self.state.by_id.get(critter_id)
         if critter:
             if all:
                 return {
@@ -159,38 +432,30 @@ class Species:
         return None
 
     def get_species_count(self, species):
-        return sum(1 for s in self.critters if s.species == species)
+        return self.stats.get_count(species)
 
     def get_critter_count(self):
-        count = {"total": 0}
-        fitness = {"total": 0}
-        species_colors = {}  # Maps species → color
-
-        for i in self.critters:
-            # Species name and color
-            species_name = i.species  # Get species name
-            species_colors[species_name] = i.color  # Store species color
-
-            # Population count
-            count["total"] += 1
-            count[species_name] = count.get(species_name, 0) + 1
-
-            # fitness count
-            fitness["total"] += i.fitness
-            fitness[species_name] = fitness.get(species_name, 0) + i.fitness
-
-        return count, fitness, species_colors
+        # Copies, so callers can hold on to them while the population changes
+        stats = self.stats
+        return dict(stats.count), dict(stats.fitness), dict(stats.colors)
 
 
 class Counter:
     def __init__(self):
         self.surface = pygame.Surface((100, 26), pygame.SRCALPHA)
-        self.font = pygame.font.Font(Fonts.PixelifySans, 22)
+        self.font = helper.get_font(Fonts.PixelifySans, 22)
         self.rect = self.surface.get_rect(topleft=(0, 0))
+        self.value = None
 
     def draw(self, value):
+        if value == self.value:
+            return
+        self.value = value
+
         # Render the counter value as text
         self.surface.fill(Colors.primary)
 
-        text = self.font.render("{:,}".format(value), True, Colors.bg_color)
+        text = helper.render_text(
+            self.font, "{:,}".format(value), True, Colors.bg_color
+        )
         self.surface.blit(text, self.rect)
@@ -0,0 +1,308 @@
+import math
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedArrays:
+    """
+    Named numpy arrays packed into one shared memory block, so worker
+    processes can read and write them without pickling. ``fields`` maps a
+    name to its (row shape, dtype); every array has ``capacity`` rows and
+    the block is reallocated at twice the size when a snapshot outgrows it.
+    """
+
+    def __init__(self, fields, capacity=1024):
+        self.fields = fields
+        self.capacity = 0
+        self.block = None
+        self.arrays = {}
+        self.reserve(capacity)
+
+    @property
+    def layout(self):
+        """What a worker needs to map the arrays, see attach()."""
+        return self.block.name, self.capacity, self.fields
+
+    def reserve(self, n):
+        if n <= self.capacity:
+            return
+        self.close()
+        self.capacity = max(n, 2 * self.capacity)
+        self.block = shared_memory.SharedMemory(
+            create=True, size=max(1, _block_size(self.capacity, self.fields))
+        )
+        self.arrays = _map_arrays(self.block, self.capacity, self.fields)
+
+    def close(self):
+        if self.block is not None:
+            self.arrays = {}  # Views must go before the buffer does
+            self.block.close()
+            self.block.unlink()
+            self.block = None
+
+
+def _block_size(capacity, fields):
+    return sum(
+        capacity * math.prod(shape) * np.dtype(dtype).itemsize
+        for shape, dtype in fields.values()
+    )
+
+
+def _map_arrays(block, capacity, fields):
+    arrays, offset = {}, 0
+    for name, (shape, dtype) in fields.items():
+        arrays[name] = np.ndarray(
+            (capacity, *shape), dtype=dtype, buffer=block.buf, offset=offset
+        )
+        offset += capacity * math.prod(shape) * np.dtype(dtype).itemsize
+    return arrays
+
+
+# Blocks mapped by this worker process, by name
+_attached = {}
+
+
+def attach(*layouts):
+    """Maps the given blocks in a worker, dropping blocks no longer in use."""
+    names = {layout[0] for layout in layouts}
+    for name in list(_attached):
+        if name not in names:
+            block, _ = _attached.pop(name)
+            block.close()
+
+    mapped = []
+    for name, capacity, fields in layouts:
+        if name not in _attached:
+            block = shared_memory.SharedMemory(name=name)
+            _attached[name] = block, _map_arrays(block, capacity, fields)
+        mapped.append(_attached[name][1])
+    return mapped
+
+
+CRITTER_FIELDS = {
+    "rect": ((4,), np.int64),
+    "center": ((2,), np.int64),
+    "cell": ((), np.int64),
+    "species": ((), np.int64),
+    # Results, by row: nearest same/other/any-species neighbour (row or -1)
+    "nearest": ((3,), np.int64),
+    "distance": ((3,), np.float64),
+    # Same/other-species critters in vision, the critter itself included
+    "density": ((2,), np.int64),
+    "food": ((), np.int64),
+    "food_distance": ((), np.float64),
+    "food_count": ((), np.int64),
+}
+
+PLANT_FIELDS = {
+    "rect": ((4,), np.int64),
+    "center": ((2,), np.int64),
+    "cell": ((), np.int64),
+}
+
+
+class PartitionedSensing:
+    """
+    Computes every critter's vision scan (nearest critters, critter
+    densities, nearest plant and plant density) for a tick in worker
+    processes, matching what NeuronManager's sensors work out one critter
+    at a time.
+
+    Critters and plants are copied into shared memory sorted by the grid
+    cell holding their center, cells being as wide as the widest vision
+    rect so everything a critter can see sits in the 3x3 cells around its
+    own. The columns of cells are split into one strip per worker; a strip
+    reads the column on either side of it as its halo and writes the
+    results for its own critters only. Nothing is mutated, so the scan is
+    a pure function of the snapshot and the strips never contend.
+
+    Ties between equally distant neighbours may resolve to a different one
+    than the serial sensors pick; either is equally valid.
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.critter_arrays = SharedArrays(CRITTER_FIELDS)
+        self.plant_arrays = SharedArrays(PLANT_FIELDS)
+        self.species_codes = {}
+        weakref.finalize(
+            self, _shutdown, self.executor, self.critter_arrays, self.plant_arrays
+        )
+
+    def scan(self, critters, forest):
+        """
+        Yields (critter, neighbourhood, food) per critter, shaped like the
+        "neighbourhood" and "food" entries of NeuronManager's context.
+        """
+        n = len(critters)
+        if not n:
+            return
+        plants = list(forest.get_plants())
+        m = len(plants)
+
+        self.critter_arrays.reserve(n)
+        self.plant_arrays.reserve(m)
+        c = self.critter_arrays.arrays
+        p = self.plant_arrays.arrays
+
+        rects = np.array([critter.rect for critter in critters], dtype=np.int64)
+        plant_rects = np.array(
+            [plant.rect for plant in plants], dtype=np.int64
+        ).reshape(m, 4)
+        reach = int(rects[:, 2:].max())
+        plant_reach = int(plant_rects[:, 2:].max(initial=0))
+        # Anything colliding with a vision rect has its center within a cell
+        cell_size = (reach + max(reach, plant_reach)) // 2 + 1
+
+        order, columns, rows = self._store(c, rects, cell_size)
+        c["species"][:n] = [
+            self.species_codes.setdefault(critters[i].species, len(self.species_codes))
+            for i in order
+        ]
+        plant_order, _, _ = self._store(p, plant_rects, cell_size, columns, rows)
+
+        bounds = np.linspace(0, columns, min(self.workers, columns) + 1).astype(int)
+        futures = [
+            self.executor.submit(
+                scan_strip,
+                self.critter_arrays.layout,
+                self.plant_arrays.layout,
+                n,
+                m,
+                rows,
+                start,
+                stop,
+            )
+            for start, stop in zip(bounds, bounds[1:])
+            if start < stop
+        ]
+        for future in futures:
+            future.result()  # Re-raises a worker's error
+
+        sorted_critters = [critters[i] for i in order]
+        sorted_plants = [plants[i] for i in plant_order]
+        nearest = c["nearest"][:n].tolist()
+        distance = c["distance"][:n].tolist()
+        density = c["density"][:n].tolist()
+        food = c["food"][:n].tolist()
+        food_distance = c["food_distance"][:n].tolist()
+        food_count = c["food_count"][:n].tolist()
+
+        keys = ("closest_same_critter", "closest_other_critter", "closest_any_critter")
+        for i, critter in enumerate(sorted_critters):
+            neighbourhood = {
+                key: (distance[i][k], sorted_critters[j] if j >= 0 else None)
+                for k, (key, j) in enumerate(zip(keys, nearest[i]))
+            }
+            same, other = density[i]
+            neighbourhood["same_critter_density"] = same
+            neighbourhood["other_critter_density"] = other
+            neighbourhood["any_critter_density"] = same + other
+
+            j = food[i]
+            nearest_food = (sorted_plants[j], food_distance[i]) if j >= 0 else None
+            yield critter, neighbourhood, (nearest_food, food_count[i])
+
+    def _store(self, arrays, rects, cell_size, columns=None, rows=None):
+        """Copies rects into arrays sorted by cell; returns the sort order."""
+        centers = rects[:, :2] + rects[:, 2:] // 2
+        cells = np.floor_divide(centers, cell_size)
+        if columns is None:
+            # Sized from the critters, so plants outside are clipped onto
+            # the edge cells; a critter can't see past them anyway
+            columns, rows = (cells.max(axis=0, initial=0) + 1).tolist()
+        cells[:, 0] = np.clip(cells[:, 0], 0, columns - 1)
+        cells[:, 1] = np.clip(cells[:, 1], 0, rows - 1)
+        keys = cells[:, 0] * rows + cells[:, 1]
+
+        order = np.argsort(keys, kind="stable")
+        n = len(rects)
+        arrays["rect"][:n] = rects[order]
+        arrays["center"][:n] = centers[order]
+        arrays["cell"][:n] = keys[order]
+        return order, columns, rows
+
+    def close(self):
+        _shutdown(self.executor, self.critter_arrays, self.plant_arrays)
+
+
+def _shutdown(executor, *shared):
+    executor.shutdown(cancel_futures=True)
+    for arrays in shared:
+        arrays.close()
+
+
+def scan_strip(critter_layout, plant_layout, n, m, rows, start, stop):
+    """Worker task: scans the critters whose cell column is in [start, stop)."""
+    c, p = attach(critter_layout, plant_layout)
+    cells, plant_cells = c["cell"][:n], p["cell"][:m]
+
+    for column in range(start, stop):
+        for row in range(rows):
+            key = column * rows + row
+            lo, hi = np.searchsorted(cells, (key, key + 1))
+            if lo == hi:
+                continue
+            # The 3x3 cells around, as one contiguous run per column
+            runs = [
+                (column + dx) * rows
+                + np.array((max(row - 1, 0), min(row + 1, rows - 1) + 1))
+                for dx in (-1, 0, 1)
+            ]
+            neighbours = _gather(cells, runs)
+            plants = _gather(plant_cells, runs)
+            _scan_cell(c, p, np.arange(lo, hi), neighbours, plants)
+
+
+def _gather(cells, runs):
+    return np.concatenate([np.arange(*np.searchsorted(cells, run)) for run in runs])
+
+
+def _colliding(rects, other_rects):
+    """pygame's colliderect, for every pair of rows."""
+    x, y, w, h = (rects[:, k, np.newaxis] for k in range(4))
+    ox, oy, ow, oh = (other_rects[np.newaxis, :, k] for k in range(4))
+    return (x < ox + ow) & (ox < x + w) & (y < oy + oh) & (oy < y + h)
+
+
+def _nearest(mask, distance_sq):
+    """Row of the closest hit per owner (-1 if none) and its distance."""
+    masked = np.where(mask, distance_sq, np.inf)
+    best = masked.argmin(axis=1)
+    best_sq = masked[np.arange(len(best)), best]
+    found = np.isfinite(best_sq)
+    return np.where(found, best, -1), np.sqrt(best_sq)
+
+
+def _scan_cell(c, p, owned, neighbours, plants):
+    centers = c["center"][owned]
+
+    hits = _colliding(c["rect"][owned], c["rect"][neighbours])
+    same = c["species"][owned, np.newaxis] == c["species"][np.newaxis, neighbours]
+    delta = centers[:, np.newaxis] - c["center"][neighbours][np.newaxis]
+    distance_sq = (delta**2).sum(axis=2).astype(np.float64)
+    others = hits & (owned[:, np.newaxis] != neighbours[np.newaxis])
+
+    for k, mask in enumerate((others & same, others & ~same, others)):
+        best, distance = _nearest(mask, distance_sq)
+        c["nearest"][owned, k] = np.where(best >= 0, neighbours[best], -1)
+        c["distance"][owned, k] = distance
+    c["density"][owned, 0] = (hits & same).sum(axis=1)
+    c["density"][owned, 1] = (hits & ~same).sum(axis=1)
+
+    if not len(plants):
+        c["food"][owned] = -1
+        c["food_distance"][owned] = np.inf
+        c["food_count"][owned] = 0
+        return
+
+    hits = _colliding(c["rect"][owned], p["rect"][plants])
+    delta = centers[:, np.newaxis] - p["center"][plants][np.newaxis]
+    best, distance = _nearest(hits, (delta**2).sum(axis=2).astype(np.float64))
+    c["food"][owned] = np.where(best >= 0, plants[best], -1)
+    c["food_distance"][owned] = distance
+    c["food_count"][owned] = hits.sum(axis=1)
@@ -0,0 +1,109 @@
+import time
+
+
+class Scheduler:
+    """
+    Paces simulation ticks independently of rendering.
+
+    The simulation owes ``tick_rate`` ticks per second of real time; each
+    frame runs the ticks owed so far, stopping early once the frame's budget
+    is spent. The budget is what the frame time leaves after rendering, but
+    never less than rendering itself takes, so slow frames get more ticks
+    rather than stalling the simulation. A tick_rate of None runs ticks until
+    the budget is spent. Debt beyond MAX_LAG seconds is dropped, so a
+    simulation that can't keep up slows down instead of starving the
+    renderer.
+
+    ``speed`` multiplies the base tick rate for fast-forwarding; a speed of
+    None runs as fast as the frame budget allows. The default base rate of
+    1000 ticks per second is the pace the loop ran at before ticks and
+    frames were split, so only drawing is held to ``frame_rate``.
+    """
+
+    # Seconds of simulation the scheduler may fall behind real time
+    MAX_LAG = 0.25
+    # Multipliers the fast-forward button cycles through, None is max
+    FAST_FORWARD_SPEEDS = (2, 10, 100, None)
+
+    def __init__(self, tick_rate=1000, frame_rate=60):
+        self.base_tick_rate = tick_rate
+        self.speed = 1
+        self.frame_rate = frame_rate
+        self.lag = 0.0  # ticks owed
+        self.last_time = None
+        self.render_time = 0.0
+
+        # Achieved rate, measured over windows of about a second
+        self.ticks_per_second = 0.0
+        self.window_start = time.perf_counter()
+        self.window_ticks = 0
+
+    @property
+    def frame_time(self):
+        return 1 / self.frame_rate
+
+    @property
+    def tick_rate(self):
+        if self.speed is None or self.base_tick_rate is None:
+            return None
+        return self.base_tick_rate * self.speed
+
+    @property
+    def fast_forwarding(self):
+        return self.speed != 1
+
+    def set_speed(self, speed):
+        self.speed = speed
+        self.reset()
+
+    def fast_forward(self):
+        """Steps to the next fast-forward multiplier, wrapping after max."""
+        speeds = self.FAST_FORWARD_SPEEDS
+        if self.speed in speeds:
+            self.set_speed(speeds[(speeds.index(self.speed) + 1) % len(speeds)])
+        else:
+            self.set_speed(speeds[0])
+
+    def reset(self):
+        """Forgets owed ticks, e.g. after a pause."""
+        self.lag = 0.0
+        self.last_time = None
+
+    def ticks(self):
+        """Yields once for every tick to run this frame."""
+        start = time.perf_counter()
+        self._measure(start)
+        if self.last_time is None:
+            self.last_time = start
+        deadline = start + max(self.frame_time - self.render_time, self.render_time)
+
+        tick_rate = self.tick_rate
+        if tick_rate is None:
+            self.last_time = start
+            self.window_ticks += 1
+            yield
+            while time.perf_counter() < deadline:
+                self.window_ticks += 1
+                yield
+            return
+
+        self.lag = min(
+            self.lag + (start - self.last_time) * tick_rate,
+            self.MAX_LAG * tick_rate,
+        )
+        self.last_time = start
+        while self.lag >= 1 and time.perf_counter() < deadline:
+            self.lag -= 1
+            self.window_ticks += 1
+            yield
+
+    def _measure(self, now):
+        elapsed = now - self.window_start
+        if elapsed >= 1:
+            self.ticks_per_second = self.window_ticks / elapsed
+            self.window_start = now
+            self.window_ticks = 0
+
+    def record_render(self, seconds):
+        """Feeds a frame's render duration into the running estimate."""
+        self.render_time += (seconds - self.render_time) * 0.1
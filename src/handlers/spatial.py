@@ -0,0 +1,119 @@
+import math
+from collections import defaultdict
+
+
+class SpatialGrid:
+    """
+    Uniform hash grid over objects exposing a pygame ``rect``.
+
+    Objects are bucketed by the cell holding their rect's center; a query
+    only visits the cells that could hold a colliding rect and runs
+    ``collidelistall`` on each, so results match a scan over every object.
+    Each cell keeps its objects and their (live) rects in parallel lists.
+    """
+
+    def __init__(self, cell_size=100):
+        self.cell_size = max(1, int(cell_size))
+        self.cells = defaultdict(lambda: ([], []))
+        # obj -> (cell key, index in that cell's lists)
+        self.slots = {}
+        self.max_width = 0
+        self.max_height = 0
+
+    def __len__(self):
+        return len(self.slots)
+
+    def __contains__(self, obj):
+        return obj in self.slots
+
+    def __iter__(self):
+        return iter(self.slots)
+
+    def _key(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def rebuild(self, objects, cell_size=None):
+        """Re-buckets every object, optionally with a new cell size."""
+        if cell_size is not None:
+            self.cell_size = max(1, int(cell_size))
+        self.cells = defaultdict(lambda: ([], []))
+        self.slots = {}
+        self.max_width = 0
+        self.max_height = 0
+
+        for obj in objects:
+            self.insert(obj)
+
+    def insert(self, obj):
+        key = self._key(*obj.rect.center)
+        objs, rects = self.cells[key]
+        self.slots[obj] = (key, len(objs))
+        objs.append(obj)
+        rects.append(obj.rect)
+        self.max_width = max(self.max_width, obj.rect.width)
+        self.max_height = max(self.max_height, obj.rect.height)
+
+    def remove(self, obj):
+        """Drops obj in O(1) by moving its cell's last object into its slot."""
+        slot = self.slots.pop(obj, None)
+        if slot is None:
+            return
+        key, index = slot
+        objs, rects = self.cells[key]
+        last_obj, last_rect = objs.pop(), rects.pop()
+        if last_obj is not obj:
+            objs[index] = last_obj
+            rects[index] = last_rect
+            self.slots[last_obj] = (key, index)
+        elif not objs:
+            del self.cells[key]
+
+    def move(self, obj):
+        """Re-buckets obj after its rect moved; inserts it if not tracked."""
+        slot = self.slots.get(obj)
+        if slot is not None and slot[0] == self._key(*obj.rect.center):
+            return
+        self.remove(obj)
+        self.insert(obj)
+
+    def cells_around(self, rect):
+        """Yields the (objects, rects) of every cell a colliding rect could sit in."""
+        # A colliding rect's center is at most half its size outside `rect`
+        half_w = self.max_width // 2 + 1
+        half_h = self.max_height // 2 + 1
+        x0, y0 = self._key(rect.left - half_w, rect.top - half_h)
+        x1, y1 = self._key(rect.right + half_w, rect.bottom + half_h)
+        cells = self.cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    yield cell
+
+    def query(self, rect):
+        """Returns every tracked object whose rect collides with `rect`."""
+        found = []
+        for objs, rects in self.cells_around(rect):
+            found.extend([objs[i] for i in rect.collidelistall(rects)])
+        return found
+
+    def count(self, rect):
+        """Returns how many tracked objects collide with `rect`."""
+        return sum(len(rect.collidelistall(rects)) for _, rects in self.cells_around(rect))
+
+    def nearest(self, rect):
+        """
+        Returns (object, distance) for the colliding object whose center is
+        closest to rect's center, or None when nothing collides.
+        """
+        cx, cy = rect.center
+        best, best_distance = None, math.inf
+        for objs, rects in self.cells_around(rect):
+            for i in rect.collidelistall(rects):
+                x, y = rects[i].center
+                distance = math.sqrt((cx - x) ** 2 + (cy - y) ** 2)
+                if distance < best_distance:
+                    best, best_distance = objs[i], distance
+        if best is None:
+            return None
+        return best, best_distance
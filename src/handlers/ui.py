@@ -3,13 +3,16 @@ import pygame
 from src.enums import Pages
 from src.components.home import HomeComponent
 from src.components.laboratory import LaboratoryComponent
-
+from src.handlers import assets
 
 class UIHandler:
     def __init__(self):
         self.surface = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
         self.surface.fill((26, 26, 26))
         pygame.display.set_caption("TheLifeOfPy")
+        # Screens are rebuilt on every navigation, from the shared rasters
+        assets.preload_images()
+        self.full_redraw = True
 
         self.screen_states = {
             "current_screen": Pages.HOME,
@@ -37,6 +40,8 @@ class UIHandler:
         if screen not in self.screen_states["screens"]:
             raise ValueError(f"Invalid screen: {screen}")
         self.screen_states["current_screen"] = screen
+        # A new screen starts from a blank display
+        self.full_redraw = True
         self.screen_states["rendered_components"] = {}
 
         rendered_component = self.screen_states[screen]["handler"](
@@ -58,20 +63,44 @@ class UIHandler:
                 yield info["handler"].event_handler(event) or []
 
     def update_screen(self, context=None):
-        self.surface.fill((26, 26, 26))
+        """
+        Has every screen redraw what changed and pushes only those regions
+        to the display. Handlers return the rects they dirtied on their own
+        surface, or None when all of it changed.
+        """
+        if self.full_redraw:
+            self.surface.fill((26, 26, 26))
 
+        dirty_rects = []
         for name, info in self.screen_states["rendered_components"].items():
-            info["handler"].update(context=context)
-            rect = info["handler"].surface.get_rect(**info["custom_position"])
-            self.surface.blit(info["handler"].surface, dest=rect)
+            handler = info["handler"]
+            rects = handler.update(context=context)
+            rect = handler.surface.get_rect(**info["custom_position"])
+            if rects is None:
+                rects = [handler.surface.get_rect()]
+
+            for dirty_rect in rects:
+                dest = dirty_rect.move(rect.topleft)
+                # Home draws straight onto the display surface
+                if handler.surface is not self.surface:
+                    self.surface.blit(handler.surface, dest, area=dirty_rect)
+                dirty_rects.append(dest)
+
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
 
-        pygame.display.flip()
+    @property
+    def current_screen(self):
+        return self.screen_states["current_screen"]
 
     def get_component(self, name):
-        current_screen = self.screen_states["current_screen"]
+        current_screen = self.current_screen
         for component in self.screen_states["rendered_components"][current_screen][
             "handler"
         ].components:
             if component["name"] == name:
                 return component["rendered_handler"]
-        return ValueError(f"Component {name} not found in {current_screen}")
+        raise ValueError(f"Component {name} not found in {current_screen}")
@@ -1,4 +1,5 @@
 import colorsys
+import functools
 import math
 import random
 import numpy as np
@@ -36,6 +37,23 @@ def split_text(text, char_limit=42):
     return lines
 
 
+class WorldBounds:
+    """Plain stand-in for the env surface when the simulation runs headless."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    def get_width(self):
+        return self.width
+
+    def get_height(self):
+        return self.height
+
+    def get_size(self):
+        return self.width, self.height
+
+
 def get_random_position(env_window):
     return (
         random.randint(0, env_window.get_width()),
@@ -204,6 +222,39 @@ def scale_image_by_factor(image, factor):
     return image
 
 
+def blit_many(surface, blit_sequence):
+    """Blits (source, dest) pairs in one call; uses pygame-ce's fblits if present."""
+    if hasattr(surface, "fblits"):
+        surface.fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(path, size):
+    """Returns the shared Font for (path, size), loading it on first use."""
+    return pygame.font.Font(path, size)
+
+
+def render_text(font, text, antialias, color, background=None):
+    """
+    Returns the rendered text surface, reusing the last renders of the same
+    (font, text, colors). The surface is shared, so blit it, don't draw on it.
+    """
+    return _render_text(
+        font,
+        str(text),
+        bool(antialias),
+        tuple(color),
+        None if background is None else tuple(background),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_text(font, text, antialias, color, background):
+    return font.render(text, antialias, color, background)
+
+
 def hex_to_rgb(hex_color: str):
     hex_color = hex_color.lstrip("#")
     hex_color = hex_color.ljust(6, "0")
@@ -1,24 +1,52 @@
 import os
 import sys
+import time
+
 import pygame
 
 from src.enums import Attributes, EventType, MessagePacket, Pages
 from src.handlers import genetics
+from src.handlers.history import SeriesHistory
+from src.handlers.parallel import PartitionedSensing
 import src.handlers.organisms as organisms
+from src.handlers.scheduler import Scheduler
 from src.handlers.ui import UIHandler
-from src.config import image_assets
-
+from src import helper
+from src.config import ENV_HEIGHT, ENV_WIDTH, SIM_WORKERS, image_assets
 
 class Nature:
-    def __init__(self):
+
+    def __init__(
+        self, headless=False, world_size=(ENV_WIDTH, ENV_HEIGHT), workers=SIM_WORKERS
+    ):
+        """
+        Creates the simulation. With headless=True no display, fonts or
+        assets are touched; call attach_ui() later to start watching.
+        workers > 0 scans critter vision on that many processes.
+        """
+        self.clock = pygame.time.Clock()
+        self.scheduler = Scheduler()
+        self.ui_handler = None
+        self.world = helper.WorldBounds(*world_size)
+        # Kept across resets, so the worker pool is only started once
+        self.scanner = PartitionedSensing(workers) if workers else None
+
+        self.reset()
+        if not headless:
+            self.attach_ui()
+
+    def attach_ui(self):
         icon = pygame.image.load(os.path.join(image_assets, "icons", "256x256.png"))
         icon = pygame.transform.scale(icon, (32, 32))
         pygame.display.set_icon(icon)
 
         pygame.font.init()
-        self.clock = pygame.time.Clock()
         self.ui_handler = UIHandler()
-        self.reset()
+        self.ui_handler.initialize_screen(screen=Pages.HOME)
+
+    @property
+    def headless(self):
+        return self.ui_handler is None
 
     def reset(self):
         self.time_steps = 0
@@ -26,31 +54,80 @@ class Nature:
         self.truncated = False
         self.paused = False
 
-        self.ui_handler.initialize_screen(screen=Pages.HOME)
-        env_surface = self.ui_handler.get_component(name="EnvComponent").surface
-        self.neuron_manager = genetics.NeuronManager()
-
-        self.species = organisms.Species(
+        if not self.headless:
+            self.ui_handler.initialize_screen(screen=Pages.HOME)
+        self.forest = organisms.Forest(
             context={
-                "env_surface": env_surface,
-                "neuron_manager": self.neuron_manager,
+                "world": self.world,
             }
         )
-        self.forest = organisms.Forest(
+        self.neuron_manager = genetics.NeuronManager(
+            forest=self.forest, scanner=self.scanner
+        )
+
+        self.species = organisms.Species(
             context={
-                "env_surface": env_surface,
+                "world": self.world,
+                "neuron_manager": self.neuron_manager,
             }
         )
 
         self.critters = []
         self.plants = self.forest.bulk_generate_plants_patch(n=20)
-        self.population_history = []
-        self.fitness_history = []
-        self.plant_history = [(0, 0)]
+        self.neuron_manager.update(self.species.get_critters())
+        self.population_history = SeriesHistory()
+        self.fitness_history = SeriesHistory()
+        self.plant_history = SeriesHistory()
+        self.plant_history.append(0, {"total": 0})
         self.species_colors = {}
         self.selected_critter = {"id": None, "data": None}
 
-    def step(self):
+    def create_species(self, data):
+        """Releases a lab-designed species (the GENESIS packet payload)."""
+        data = data.copy()
+        self.critters = self.species.create_species(
+            n=data.pop(Attributes.BASE_POPULATION), context=data
+        )
+        return self.critters
+
+    def step(self, events=()):
+        """Advances the simulation by one tick."""
+        if self.paused:
+            return self.done, self.truncated
+
+        self.species.step(events)
+
+        if self.time_steps % 75 == 0:
+            self.forest.create_plant_patch()
+
+        self.neuron_manager.update(
+            self.species.get_critters(),
+            mouse_position=self.get_mouse_position(),
+        )
+
+        self.truncated = False
+
+        if self.time_steps % 50 == 0:
+            critter_count, fitness, self.species_colors = (
+                self.species.get_critter_count()
+            )
+            self.population_history.append(self.time_steps, critter_count)
+            self.fitness_history.append(self.time_steps, fitness)
+            self.plant_history.append(
+                self.time_steps + 1, {"total": self.forest.get_plant_count()}
+            )
+
+        self.time_steps += 1
+        return self.done, self.truncated
+
+    def get_mouse_position(self):
+        """World point under the mouse pointer, None when it isn't over the env."""
+        if self.headless or self.ui_handler.current_screen != Pages.HOME:
+            return None
+        env = self.ui_handler.get_component("EnvComponent")
+        return env.get_world_position(pygame.mouse.get_pos())
+
+    def handle_events(self):
         events = pygame.event.get()
         packet = list(self.ui_handler.event_handler(events))
         if packet:
@@ -61,14 +138,15 @@ class Nature:
                 self.paused = True
             elif packet == "play_time":
                 self.paused = False
+                self.scheduler.set_speed(1)
+            elif packet == "fast_forward":
+                self.paused = False
+                self.scheduler.fast_forward()
             elif packet == MessagePacket(EventType.NAVIGATION, Pages.HOME):
                 self.ui_handler.initialize_screen(screen=Pages.HOME)
                 self.selected_critter.update({"id": None, "data": None})
                 if EventType.GENESIS in packet.context:
-                    data = packet.context[EventType.GENESIS]
-                    self.critters = self.species.create_species(
-                        n=data.pop(Attributes.BASE_POPULATION), context=data
-                    )
+                    self.create_species(packet.context[EventType.GENESIS])
                 elif EventType.RESTART_SIMULATION in packet.context:
                     self.reset()
             elif packet == MessagePacket(EventType.NAVIGATION, Pages.PROFILE):
@@ -79,6 +157,9 @@ class Nature:
             elif packet == MessagePacket(EventType.NAVIGATION, Pages.LABORATORY):
                 self.ui_handler.initialize_screen(screen=Pages.LABORATORY)
 
+        return events
+
+    def refresh_selected_critter(self):
         if self.selected_critter["id"]:
             data = self.species.get_critter_info(self.selected_critter["id"], all=False)
             if data is None:
@@ -87,47 +168,47 @@ class Nature:
             else:
                 self.selected_critter["data"].update(data)
 
-        if self.paused:
-            return self.done, self.truncated
-
-        self.species.step(events)
-        self.neuron_manager.update(
-            self.species.get_critters(),
-            self.forest.get_plants(),
-        )
-
-        self.clock.tick(1000)
-        self.truncated = False
-
-        if self.time_steps % 75 == 0:
-            self.forest.create_plant_patch()
-
-        if self.time_steps % 50 == 0:
-            critter_count, fitness, self.species_colors = (
-                self.species.get_critter_count()
-            )
-            self.population_history.append((self.time_steps, critter_count))
-            self.fitness_history.append((self.time_steps, fitness))
-            self.plant_history.append(
-                (self.time_steps + 1, self.forest.get_plant_count())
-            )
-
-        self.time_steps += 1
-        return self.done, self.truncated
-
     def run(self):
         try:
             self.render()
             while 1 + 1 == 2:
-                self.step()
-                self.render()
+                self.run_frame()
         except KeyboardInterrupt:
             pygame.quit()
             sys.exit(0)
         except Exception as e:
             raise
 
+    def run_frame(self):
+        """
+        Handles input, runs the ticks the scheduler asks for and redraws,
+        capped at the scheduler's frame rate. On the home screen, frames in
+        which nothing ticked and no input arrived are not redrawn.
+        """
+        events = self.handle_events()
+
+        ticks = 0
+        if self.paused:
+            self.scheduler.reset()
+        else:
+            for _ in self.scheduler.ticks():
+                self.step(events if not ticks else ())
+                ticks += 1
+
+        # Only the home view is static between ticks, the lab animates
+        animating = not self.headless and self.ui_handler.current_screen != Pages.HOME
+        if ticks or events or animating:
+            self.refresh_selected_critter()
+            start = time.perf_counter()
+            self.render()
+            self.scheduler.record_render(time.perf_counter() - start)
+
+        self.clock.tick(self.scheduler.frame_rate)
+
     def render(self):
+        if self.headless:
+            return
+
         self.ui_handler.update_screen(
             context={
                 "critters": self.species.get_critters(),
@@ -138,7 +219,13 @@ class Nature:
                 "species_colors": self.species_colors,
                 "time": self.time_steps,
                 "paused": self.paused,
-                "plants": self.forest.get_plants(),
+                "speed": self.scheduler.speed,
+                "fast_forward": self.scheduler.fast_forwarding,
+                "ticks_per_second": self.scheduler.ticks_per_second,
+                "forest": self.forest,
+                "world": self.world,
+                "critter_grid": self.neuron_manager.critter_grid,
+                "critter_state": self.species.state,
                 "selected_critter": self.selected_critter["data"],
             }
         )